@@ -0,0 +1,7 @@
+"""Location of the devpod executable, shared by the CLI and the worktree backend."""
+
+import shutil
+
+# Resolved once so each devpod call skips the $PATH search; falls back to a bare name
+# (resolved by the OS at exec time) if devpod isn't on PATH at import.
+_DEVPOD_BIN = shutil.which("devpod") or "devpod"
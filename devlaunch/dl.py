@@ -20,16 +20,19 @@ Usage:
 
 import sys
 import subprocess
+import functools
 import json
 import logging
 import os
 import pathlib
 import re
+import shutil
 from importlib.metadata import version as pkg_version, PackageNotFoundError
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
 from .completion import install_completions
+from .devpod_bin import _DEVPOD_BIN
 
 
 def get_version() -> str:
@@ -192,11 +195,9 @@ def purge_all_data() -> int:
     2. Removes ~/.cache/devlaunch/ which contains:
        - repos/ (cloned repositories)
        - worktrees/ (git worktrees)
-       - metadata.json (worktree tracking)
+       - metadata.json, metadata.jsonl (worktree tracking)
        - completions.json, completions.bash (completion caches)
     """
-    import shutil
-
     cache_dir = _get_cache_dir()
 
     # First, delete DevPod workspaces tracked in our metadata
@@ -306,6 +307,7 @@ def sanitize_workspace_id(name: str) -> str:
     return name.lower().replace("/", "-")
 
 
+@functools.lru_cache(maxsize=256)
 def get_worktree_container_path(workspace_id: str, branch: str) -> str:
     """Get the container path for a worktree.
 
@@ -704,7 +706,7 @@ def run_devpod(args: List[str], capture: bool = False) -> subprocess.CompletedPr
     command injection. Each list element is passed as a separate argument to
     the executable, so special characters are not interpreted by a shell.
     """
-    cmd = ["devpod"] + args
+    cmd = [_DEVPOD_BIN, *args]
     logging.debug("Running: %s", " ".join(cmd))
     if capture:
         # nosec B603 - using list form, not shell=True; no command injection risk
@@ -749,8 +751,13 @@ def should_use_worktree_backend(spec: str, backend: Optional[str] = None) -> boo
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_worktree_managers():
-    """Get initialized worktree managers."""
+    """Get initialized worktree managers.
+
+    Cached so one dl invocation loads the config and metadata storage once,
+    however many worktree helpers it goes through.
+    """
     from .worktree import (
         WorkspaceManager,
         WorktreeManager,
@@ -1089,7 +1096,7 @@ def main() -> int:
         print(f"  - {cache_dir}/")
         print("      - repos/ (cloned repositories)")
         print("      - worktrees/ (git worktrees)")
-        print("      - metadata.json (worktree tracking)")
+        print("      - metadata.json, metadata.jsonl (worktree tracking)")
         print("      - completions.* (completion caches)")
         print()
         if skip_confirm:
@@ -1165,6 +1172,16 @@ def main() -> int:
     # Determine if we should use worktree backend
     use_worktree = should_use_worktree_backend(raw_spec, backend_override)
 
+    # The default branch lookup may query the remote, so it runs only when a worktree
+    # flow first needs the branch and its answer is reused after that
+    worktree_branch = parsed[1] if parsed else None
+
+    def resolve_worktree_branch(owner: str, repo: str) -> str:
+        nonlocal worktree_branch
+        if not worktree_branch:
+            worktree_branch = get_default_branch_for_repo(owner, repo)
+        return worktree_branch
+
     if is_existing:
         workspace_spec = raw_spec
         workspace_id = raw_spec
@@ -1173,12 +1190,13 @@ def main() -> int:
         # For worktree backend, workspace ID includes owner-repo-branch (or just owner-repo if shared)
         owner_repo = parsed[0]
         owner, repo = owner_repo.split("/")
-        branch = parsed[1] if parsed[1] else get_default_branch_for_repo(owner, repo)
         workspace_spec = expand_workspace_spec(raw_spec)
         if share_container:
             workspace_id = make_shared_workspace_id(owner, repo)
         else:
-            workspace_id = make_worktree_workspace_id(owner, repo, branch)
+            workspace_id = make_worktree_workspace_id(
+                owner, repo, resolve_worktree_branch(owner, repo)
+            )
         custom_id = workspace_id
     else:
         workspace_spec = expand_workspace_spec(raw_spec)
@@ -1203,11 +1221,10 @@ def main() -> int:
         if use_worktree and parsed:
             owner_repo = parsed[0]
             owner, repo = owner_repo.split("/")
-            branch = parsed[1] if parsed[1] else get_default_branch_for_repo(owner, repo)
             result = workspace_up_worktree(
                 owner,
                 repo,
-                branch,
+                resolve_worktree_branch(owner, repo),
                 workspace_id=custom_id,
                 ide="vscode",
                 share_container=share_container,
@@ -1231,13 +1248,18 @@ def main() -> int:
         if use_worktree and parsed:
             owner_repo = parsed[0]
             owner, repo = owner_repo.split("/")
-            branch = parsed[1] if parsed[1] else get_default_branch_for_repo(owner, repo)
             result = workspace_up_worktree(
-                owner, repo, branch, workspace_id=custom_id, share_container=share_container
+                owner,
+                repo,
+                resolve_worktree_branch(owner, repo),
+                workspace_id=custom_id,
+                share_container=share_container,
             )
             if result.returncode != 0:
                 return result.returncode
-            workdir = get_worktree_container_path(workspace_id, branch)
+            workdir = get_worktree_container_path(
+                workspace_id, resolve_worktree_branch(owner, repo)
+            )
             return workspace_ssh(workspace_id, workdir=workdir)
 
         result = workspace_up(workspace_spec, workspace_id=custom_id)
@@ -1268,9 +1290,12 @@ def main() -> int:
         if use_worktree and parsed:
             owner_repo = parsed[0]
             owner, repo = owner_repo.split("/")
-            branch = parsed[1] if parsed[1] else get_default_branch_for_repo(owner, repo)
             result = workspace_up_worktree(
-                owner, repo, branch, workspace_id=custom_id, share_container=share_container
+                owner,
+                repo,
+                resolve_worktree_branch(owner, repo),
+                workspace_id=custom_id,
+                share_container=share_container,
             )
         else:
             result = workspace_up(workspace_spec, workspace_id=custom_id)
@@ -1290,12 +1315,7 @@ def main() -> int:
     # Attach to workspace
     # For worktree backend, set workdir to the worktree path inside the mounted base repo
     if use_worktree and parsed:
-        branch = (
-            parsed[1]
-            if parsed[1]
-            else get_default_branch_for_repo(parsed[0].split("/")[0], parsed[0].split("/")[1])
-        )
-        workdir = get_worktree_container_path(workspace_id, branch)
+        workdir = get_worktree_container_path(workspace_id, resolve_worktree_branch(owner, repo))
         ret = workspace_ssh(workspace_id, shell_command, workdir=workdir)
     else:
         ret = workspace_ssh(workspace_id, shell_command)
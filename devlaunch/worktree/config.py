@@ -33,6 +33,7 @@ class WorktreeConfig:
     auto_prune: bool = True
     prune_after_days: int = 30
     fallback_image: Optional[str] = None  # Docker image to use for repos without devcontainer.json
+    ssh_multiplex: bool = False  # Share one SSH connection per host across git commands
 
     def __post_init__(self):
         """Ensure paths are Path objects and expand user."""
@@ -66,6 +67,8 @@ class WorktreeConfig:
         }
         if self.fallback_image:
             result["worktree"]["fallback_image"] = self.fallback_image
+        if self.ssh_multiplex:
+            result["worktree"]["ssh_multiplex"] = True
         return result
 
     @classmethod
@@ -82,6 +85,7 @@ class WorktreeConfig:
             auto_prune=cleanup_data.get("auto_prune", True),
             prune_after_days=cleanup_data.get("prune_after_days", 30),
             fallback_image=worktree_data.get("fallback_image"),
+            ssh_multiplex=worktree_data.get("ssh_multiplex", False),
         )
 
 
@@ -1,12 +1,12 @@
 """Data models for worktree backend."""
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseRepository:
     """Represents a base git repository."""
 
@@ -18,12 +18,22 @@ class BaseRepository:
     last_fetched: Optional[datetime] = None
     worktrees: List[str] = field(default_factory=list)  # List of active worktree branch names
 
+    @property
+    def key(self) -> str:
+        """Storage key for this repository (owner/repo)."""
+        return f"{self.owner}/{self.repo}"
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        data["local_path"] = str(self.local_path)
-        data["last_fetched"] = self.last_fetched.isoformat() if self.last_fetched else None
-        return data
+        return {
+            "owner": self.owner,
+            "repo": self.repo,
+            "remote_url": self.remote_url,
+            "local_path": str(self.local_path),
+            "default_branch": self.default_branch,
+            "last_fetched": self.last_fetched.isoformat() if self.last_fetched else None,
+            "worktrees": list(self.worktrees),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "BaseRepository":
@@ -35,7 +45,7 @@ class BaseRepository:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorktreeInfo:
     """Represents a git worktree."""
 
@@ -48,13 +58,23 @@ class WorktreeInfo:
     last_used: datetime = field(default_factory=datetime.now)
     devpod_workspace_id: Optional[str] = None  # Associated DevPod workspace
 
+    @property
+    def key(self) -> str:
+        """Storage key for this worktree (owner/repo/branch)."""
+        return f"{self.owner}/{self.repo}/{self.branch}"
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        data["local_path"] = str(self.local_path)
-        data["created_at"] = self.created_at.isoformat()
-        data["last_used"] = self.last_used.isoformat()
-        return data
+        return {
+            "owner": self.owner,
+            "repo": self.repo,
+            "branch": self.branch,
+            "local_path": str(self.local_path),
+            "workspace_id": self.workspace_id,
+            "created_at": self.created_at.isoformat(),
+            "last_used": self.last_used.isoformat(),
+            "devpod_workspace_id": self.devpod_workspace_id,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "WorktreeInfo":
@@ -1,12 +1,16 @@
 """Storage utilities for worktree metadata."""
 
 import json
+import logging
 import os
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from .models import BaseRepository, WorktreeInfo
 
+logger = logging.getLogger(__name__)
+
 
 def _get_default_metadata_path() -> Path:
     """Get the default metadata path, honoring XDG_CACHE_HOME."""
@@ -16,19 +20,34 @@ def _get_default_metadata_path() -> Path:
     return Path.home() / ".cache" / "devlaunch" / "metadata.json"
 
 
+# Compact the mutation log into the metadata file once it grows past this size
+LOG_COMPACT_THRESHOLD = 64 * 1024
+
+
 class MetadataStorage:
-    """Handles persistent storage of worktree metadata."""
+    """Handles persistent storage of worktree metadata.
+
+    The full state lives in ``metadata.json``. Each mutation is appended as a
+    single line to a ``metadata.jsonl`` sidecar log instead of rewriting the
+    whole file, so mutation cost is proportional to the record, not the state.
+    Loading replays the log on top of the JSON snapshot, and the log is folded
+    back into the snapshot by ``save()`` or once it exceeds
+    ``LOG_COMPACT_THRESHOLD`` bytes.
+    """
 
     def __init__(self, metadata_path: Optional[Path] = None):
         """Initialize metadata storage."""
         if metadata_path is None:
             metadata_path = _get_default_metadata_path()
         self.metadata_path = metadata_path
+        self._log_path = metadata_path.with_suffix(".jsonl")
+        # Serializes mutations so managers can be driven from worker threads
+        self._lock = threading.RLock()
         self.metadata_path.parent.mkdir(parents=True, exist_ok=True)
         self._load()
 
     def _load(self) -> None:
-        """Load metadata from disk."""
+        """Load metadata from disk, replaying any logged mutations."""
         if self.metadata_path.exists():
             with open(self.metadata_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -46,21 +65,88 @@ class MetadataStorage:
         for key, worktree_data in data.get("worktrees", {}).items():
             self.worktrees[key] = WorktreeInfo.from_dict(worktree_data)
 
-    def save(self) -> None:
-        """Save metadata to disk."""
+        # Replay mutations logged since the last compaction
+        if self._log_path.exists():
+            self._replay_log()
+
+    def _replay_log(self) -> None:
+        """Apply every complete log record, truncating a torn tail.
+
+        Only an unterminated final line is a torn write; a corrupt line in the
+        middle of the log is skipped so the records after it still apply.
+        """
+        complete_size = 0
+        torn = False
+        with open(self._log_path, "rb") as f:
+            for lineno, line in enumerate(f, start=1):
+                if not line.endswith(b"\n"):
+                    # A torn final line from an interrupted write
+                    torn = True
+                    break
+                complete_size += len(line)
+                try:
+                    record = json.loads(line)
+                    self._apply(record["op"], record["data"])
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    logger.warning(
+                        f"Skipping corrupt record on line {lineno} of {self._log_path}: {e}"
+                    )
+
+        if torn:
+            # Cut the log back to its last complete record so later appends start on
+            # a fresh line instead of being glued onto the torn one and lost
+            os.truncate(self._log_path, complete_size)
+
+    def _apply(self, op: str, data: Dict) -> None:
+        """Apply a single logged mutation to the in-memory state."""
+        if op == "add_repo":
+            repo = BaseRepository.from_dict(data)
+            self.repositories[repo.key] = repo
+        elif op == "remove_repo":
+            self.repositories.pop(data["key"], None)
+        elif op == "add_worktree":
+            worktree = WorktreeInfo.from_dict(data)
+            self.worktrees[worktree.key] = worktree
+        elif op == "remove_worktree":
+            self.worktrees.pop(data["key"], None)
+
+    def _append(self, op: str, data: Dict) -> None:
+        """Durably append a mutation record to the log, compacting if it grew too large."""
+        line = json.dumps({"op": op, "data": data}) + "\n"
+        with open(self._log_path, "ab") as f:
+            f.write(line.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            log_size = f.tell()
+        if log_size > LOG_COMPACT_THRESHOLD:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Write the merged state to the metadata file and truncate the log."""
         data = {
             "repositories": {key: repo.to_dict() for key, repo in self.repositories.items()},
             "worktrees": {key: worktree.to_dict() for key, worktree in self.worktrees.items()},
         }
 
-        with open(self.metadata_path, "w", encoding="utf-8") as f:
+        # Write to a temp file and swap it in so readers never see a partial file
+        tmp_path = self.metadata_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.metadata_path)
+        # Replaying the log over the new snapshot is idempotent, so a crash
+        # before this point loses nothing
+        self._log_path.unlink(missing_ok=True)
+
+    def save(self) -> None:
+        """Save the full metadata to disk, folding in the mutation log."""
+        with self._lock:
+            self._compact()
 
     def add_repository(self, repo: BaseRepository) -> None:
         """Add or update a repository."""
-        key = f"{repo.owner}/{repo.repo}"
-        self.repositories[key] = repo
-        self.save()
+        with self._lock:
+            self.repositories[repo.key] = repo
+            self._append("add_repo", repo.to_dict())
 
     def get_repository(self, owner: str, repo: str) -> Optional[BaseRepository]:
         """Get a repository by owner and name."""
@@ -74,22 +160,22 @@ class MetadataStorage:
     def remove_repository(self, owner: str, repo: str) -> None:
         """Remove a repository."""
         key = f"{owner}/{repo}"
-        if key in self.repositories:
-            del self.repositories[key]
-            self.save()
+        with self._lock:
+            if key in self.repositories:
+                del self.repositories[key]
+                self._append("remove_repo", {"key": key})
 
     def add_worktree(self, worktree: WorktreeInfo) -> None:
         """Add or update a worktree."""
-        key = f"{worktree.owner}/{worktree.repo}/{worktree.branch}"
-        self.worktrees[key] = worktree
-
-        # Update repository's worktree list
-        repo = self.get_repository(worktree.owner, worktree.repo)
-        if repo and worktree.branch not in repo.worktrees:
-            repo.worktrees.append(worktree.branch)
-            self.add_repository(repo)
+        with self._lock:
+            self.worktrees[worktree.key] = worktree
+            self._append("add_worktree", worktree.to_dict())
 
-        self.save()
+            # Update repository's worktree list
+            repo = self.get_repository(worktree.owner, worktree.repo)
+            if repo and worktree.branch not in repo.worktrees:
+                repo.worktrees.append(worktree.branch)
+                self.add_repository(repo)
 
     def get_worktree(self, owner: str, repo: str, branch: str) -> Optional[WorktreeInfo]:
         """Get a worktree by repository and branch."""
@@ -112,13 +198,13 @@ class MetadataStorage:
     def remove_worktree(self, owner: str, repo: str, branch: str) -> None:
         """Remove a worktree."""
         key = f"{owner}/{repo}/{branch}"
-        if key in self.worktrees:
-            del self.worktrees[key]
-
-            # Update repository's worktree list
-            repo_obj = self.get_repository(owner, repo)
-            if repo_obj and branch in repo_obj.worktrees:
-                repo_obj.worktrees.remove(branch)
-                self.add_repository(repo_obj)
-
-            self.save()
+        with self._lock:
+            if key in self.worktrees:
+                del self.worktrees[key]
+                self._append("remove_worktree", {"key": key})
+
+                # Update repository's worktree list
+                repo_obj = self.get_repository(owner, repo)
+                if repo_obj and branch in repo_obj.worktrees:
+                    repo_obj.worktrees.remove(branch)
+                    self.add_repository(repo_obj)
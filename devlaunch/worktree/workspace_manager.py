@@ -33,11 +33,14 @@ This ensures git commands work correctly inside the container.
 """
 
 import fcntl
+import json
 import logging
 import subprocess
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Generator, List, Optional, Tuple
 
+from ..devpod_bin import _DEVPOD_BIN
 from .models import WorktreeInfo
 from .storage import MetadataStorage
 from .worktree_manager import WorktreeManager, sanitize_branch_name
@@ -58,13 +61,29 @@ def run_devpod(args: List[str], capture: bool = False) -> subprocess.CompletedPr
     Returns:
         CompletedProcess result
     """
-    cmd = ["devpod"] + args
+    cmd = [_DEVPOD_BIN, *args]
     logging.debug("Running: %s", " ".join(cmd))
     if capture:
         return subprocess.run(cmd, capture_output=True, text=True, check=False)
     return subprocess.run(cmd, check=False)
 
 
+@contextmanager
+def _locked(lock_path: Path) -> Generator[None, None, None]:
+    """Hold an exclusive flock on lock_path for the duration of the block.
+
+    The lock file is opened once and its descriptor kept open until the lock
+    is released, so acquire and release cost one open/close pair.
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "w", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
 class WorkspaceManager:
     """Manages DevPod workspaces backed by worktrees."""
 
@@ -104,34 +123,26 @@ class WorkspaceManager:
             Tuple of (WorktreeInfo, devpod_output)
         """
         # Acquire lock to prevent race conditions with parallel operations
-        lock_dir = Path.home() / ".devlaunch" / "locks"
-        lock_dir.mkdir(parents=True, exist_ok=True)
-        lock_file = lock_dir / f"{owner}-{repo}.lock"
-
-        with open(lock_file, "w", encoding="utf-8") as f:
-            fcntl.flock(f, fcntl.LOCK_EX)
-            try:
-                return self._create_workspace_locked(
-                    owner,
-                    repo,
-                    branch,
-                    workspace_id,
-                    remote_url,
-                    devcontainer_path,
-                    ide,
-                    fallback_image,
-                    share_container,
-                )
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
+        lock_file = Path.home() / ".devlaunch" / "locks" / f"{owner}-{repo}.lock"
+
+        with _locked(lock_file):
+            return self._create_workspace_locked(
+                owner,
+                repo,
+                branch,
+                workspace_id,
+                remote_url,
+                devcontainer_path,
+                ide,
+                fallback_image,
+                share_container,
+            )
 
     def _find_shared_workspace(self, owner: str, repo: str) -> Optional[str]:
         """Find an existing shared workspace for this repo.
 
         Returns the workspace ID if found, None otherwise.
         """
-        import json
-
         # Check DevPod workspaces for a matching shared workspace
         result = run_devpod(["list", "--output", "json"], capture=True)
         if result.returncode != 0 or not result.stdout:
@@ -290,8 +301,6 @@ class WorkspaceManager:
         Returns:
             List of workspace dictionaries with worktree info added
         """
-        import json
-
         # Get DevPod workspaces
         result = run_devpod(["list", "--output", "json"], capture=True)
         if result.returncode != 0 or not result.stdout:
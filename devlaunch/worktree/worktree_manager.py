@@ -14,7 +14,8 @@ Directory Structure
 │           └── .worktrees/    # Actual worktree directories
 │               └── main/      # Working directory for 'main' branch
 │                   └── .git   # FILE (not dir) with gitdir pointer
-└── metadata.json              # Devlaunch metadata
+├── metadata.json              # Devlaunch metadata snapshot
+└── metadata.jsonl             # Mutations appended since the last snapshot
 
 Why Worktrees Inside .worktrees/?
 ---------------------------------
@@ -51,13 +52,19 @@ logger = logging.getLogger(__name__)
 WORKTREES_DIR = ".worktrees"
 REFS_HEADS_PREFIX = "refs/heads/"
 
+# DevPod workspace IDs generated for worktrees are truncated to this length
+MAX_WORKSPACE_ID_LEN = 50
+
+# Anything outside this ASCII set is unsafe in worktree directory names
+UNSAFE_BRANCH_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9\-_.]")
+
 
 def sanitize_branch_name(branch: str) -> str:
     """Sanitize branch name for filesystem use."""
     # Replace slashes with hyphens
     sanitized = branch.replace("/", "-")
     # Remove other problematic characters
-    sanitized = re.sub(r"[^a-zA-Z0-9\-_.]", "_", sanitized)
+    sanitized = UNSAFE_BRANCH_CHARS_PATTERN.sub("_", sanitized)
     # Remove leading/trailing dots and hyphens
     sanitized = sanitized.strip(".-")
     return sanitized
@@ -284,12 +291,11 @@ class WorktreeManager:
         """Generate a workspace ID for a worktree.
 
         Format: owner-repo-branch (e.g., blooop-bencher-main)
-        Truncates if necessary to fit within 50 characters.
+        Truncates if necessary to fit within MAX_WORKSPACE_ID_LEN characters.
         """
         sanitized_branch = sanitize_branch_name(branch)
         base = f"{owner}-{repo}"
-        max_len = 50
-        available_for_branch = max_len - len(base) - 1  # -1 for separator
+        available_for_branch = MAX_WORKSPACE_ID_LEN - len(base) - 1  # -1 for separator
 
         if 0 < available_for_branch < len(sanitized_branch):
             sanitized_branch = sanitized_branch[:available_for_branch]
@@ -45,6 +45,12 @@ def pytest_configure(config):
     )
 
 
+@pytest.fixture(scope="module")
+def module_tmp_path(tmp_path_factory):
+    """Temporary directory shared by every test in one module, created once."""
+    return tmp_path_factory.mktemp("module")
+
+
 def pytest_collection_modifyitems(config, items):  # noqa: ARG001  # pylint: disable=unused-argument
     """Automatically mark tests based on their location."""
     for item in items:
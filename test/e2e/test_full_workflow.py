@@ -10,12 +10,19 @@ Run these tests with:
     docker compose -f test/docker/docker-compose.test.yml up --build
 """
 
+import inspect
 import json
 import os
 import subprocess
 
 import pytest
 
+from devlaunch import dl
+from devlaunch.worktree.config import WorktreeConfig
+from devlaunch.worktree.repo_manager import RepositoryManager
+from devlaunch.worktree.storage import MetadataStorage
+from devlaunch.worktree.worktree_manager import WorktreeManager
+
 
 @pytest.mark.e2e
 class TestWorkspaceCreationE2E:
@@ -195,11 +202,6 @@ class TestWorktreePathsInContainerE2E:
         devpod_cleanup.track(workspace_id)
 
         # First, create a worktree locally
-        from devlaunch.worktree.config import WorktreeConfig
-        from devlaunch.worktree.repo_manager import RepositoryManager
-        from devlaunch.worktree.storage import MetadataStorage
-        from devlaunch.worktree.worktree_manager import WorktreeManager
-
         config = WorktreeConfig(repos_dir=env["repos_dir"], auto_fetch=False)
         storage = MetadataStorage(env["metadata_path"])
         repo_manager = RepositoryManager(env["repos_dir"], storage, config)
@@ -279,12 +281,7 @@ class TestDLCommandSafetyE2E:
         no IDE-related arguments are passed to devpod.
         """
         # This is more of a unit test but validates E2E safety
-        # Read dl.py to verify the code path
-        from devlaunch import dl
-
         # Check that workspace_up_worktree defaults to no IDE
-        import inspect
-
         sig = inspect.signature(dl.workspace_up_worktree)
         ide_param = sig.parameters.get("ide")
         assert ide_param is not None
@@ -5,6 +5,7 @@ run actual containers. This allows testing the full git workflow while
 avoiding the overhead of real container operations.
 """
 
+import json
 import subprocess
 from collections.abc import Generator
 from typing import Dict, List, Optional
@@ -138,8 +139,6 @@ class DevPodMock:
 
     def _handle_list(self, args: List[str]) -> subprocess.CompletedProcess:
         """Handle 'devpod list' command."""
-        import json
-
         # Check if JSON output requested
         if "--output" in args and "json" in args:
             output = json.dumps(list(self.workspaces.values()))
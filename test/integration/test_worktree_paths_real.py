@@ -5,6 +5,7 @@ mounting, specifically testing the relative path fixups that make git
 work correctly inside DevPod containers.
 """
 
+import shutil
 import subprocess
 
 import pytest
@@ -161,8 +162,6 @@ class TestWorktreeContainerSimulation:
         base_repo = repo_manager.get_repo_path("test", "repo")
 
         # Copy entire repo (including .worktrees and worktrees metadata) to new location
-        import shutil
-
         new_base = tmp_path / "mounted_repo"
         shutil.copytree(base_repo, new_base)
 
@@ -195,8 +194,6 @@ class TestWorktreeContainerSimulation:
         worktree_manager.create_worktree("test", "repo", "main")
 
         # Copy to new location
-        import shutil
-
         base_repo = repo_manager.get_repo_path("test", "repo")
         new_base = tmp_path / "mounted_repo"
         shutil.copytree(base_repo, new_base)
@@ -3,6 +3,7 @@ import tempfile
 import os
 import pathlib
 import shlex
+import shutil
 import pytest
 from unittest.mock import patch
 
@@ -42,8 +43,6 @@ class TestBashCompletion:
 
     def teardown_method(self):
         """Clean up test environment."""
-        import shutil
-
         if self.test_dir and os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
 
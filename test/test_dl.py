@@ -1,10 +1,13 @@
 """Tests for dl (DevLaunch CLI) functionality."""
 
 import json
+import subprocess
 import sys
 import tempfile
 import pathlib
-from unittest.mock import patch, MagicMock
+from importlib.metadata import PackageNotFoundError
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch, MagicMock
 import pytest
 
 from devlaunch.dl import (
@@ -22,6 +25,7 @@ from devlaunch.dl import (
     OWNER_REPO_PATTERN,
     spec_to_workspace_id,
     make_worktree_workspace_id,
+    get_worktree_container_path,
     get_version,
     read_completion_cache,
     write_completion_cache,
@@ -35,11 +39,23 @@ from devlaunch.dl import (
     main,
     print_help,
     print_workspaces,
+    workspace_ssh,
     workspace_stop,
     workspace_delete,
     run_devpod,
 )
 
+# Git work dir for create_remote_branch tests; subprocess.run is mocked so it is never
+# created, and the missing .git marker makes create_remote_branch run git init.
+FAKE_GIT_DIR = pathlib.Path("/nonexistent/devlaunch-git")
+
+# Shared subprocess results for mocks whose callers only read returncode
+SUCCESS = SimpleNamespace(returncode=0)
+
+# Expected container worktree paths for workspace "blooop-bencher-main"
+EXPECTED_MAIN_WORKDIR = "/workspaces/blooop-bencher-main/.worktrees/main"
+EXPECTED_FEATURE_WORKDIR = "/workspaces/blooop-bencher-main/.worktrees/feature-my-branch"
+
 
 class TestIsPathSpec:
     """Tests for is_path_spec function."""
@@ -525,12 +541,11 @@ class TestRemoteBranchFunctions:
     @patch("subprocess.run")
     def test_create_remote_branch_success(self, mock_run, mock_git_dir):
         """Test successful branch creation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mock_git_dir.return_value = pathlib.Path(tmpdir)
-            mock_run.return_value = MagicMock(returncode=0)
-            assert create_remote_branch("owner/repo", "newbranch") is True
-            # Should call: git init (no .git exists), git fetch, git push
-            assert mock_run.call_count == 3
+        mock_git_dir.return_value = FAKE_GIT_DIR
+        mock_run.return_value = SUCCESS
+        assert create_remote_branch("owner/repo", "newbranch") is True
+        # Should call: git init (no .git exists), git fetch, git push
+        assert mock_run.call_count == 3
 
     @patch("devlaunch.dl.remote_branch_exists")
     def test_ensure_branch_exists_already(self, mock_exists):
@@ -582,8 +597,6 @@ class TestRemoteBranchFunctions:
     @patch("subprocess.run")
     def test_get_remote_branches_timeout(self, mock_run):
         """Test timeout returns empty list."""
-        import subprocess
-
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=5)
         branches = get_remote_branches("owner/repo")
         assert branches == []
@@ -617,40 +630,33 @@ class TestRemoteBranchFunctions:
     @patch("subprocess.run")
     def test_create_remote_branch_push_fails(self, mock_run, mock_git_dir):
         """Test branch creation returns False on push failure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mock_git_dir.return_value = pathlib.Path(tmpdir)
-            # git init succeeds, git fetch succeeds, git push fails
-            mock_run.side_effect = [
-                MagicMock(returncode=0),  # git init
-                MagicMock(returncode=0),  # git fetch
-                MagicMock(returncode=1, stderr="error: failed to push"),  # git push
-            ]
-            assert create_remote_branch("owner/repo", "newbranch") is False
+        mock_git_dir.return_value = FAKE_GIT_DIR
+        # git init succeeds, git fetch succeeds, git push fails
+        mock_run.side_effect = [
+            SUCCESS,  # git init
+            SUCCESS,  # git fetch
+            MagicMock(returncode=1, stderr="error: failed to push"),  # git push
+        ]
+        assert create_remote_branch("owner/repo", "newbranch") is False
 
     @patch("devlaunch.dl._get_git_work_dir")
     @patch("subprocess.run")
     def test_create_remote_branch_os_error(self, mock_run, mock_git_dir):
         """Test branch creation handles OSError."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mock_git_dir.return_value = pathlib.Path(tmpdir)
-            mock_run.side_effect = OSError("git not found")
-            assert create_remote_branch("owner/repo", "newbranch") is False
+        mock_git_dir.return_value = FAKE_GIT_DIR
+        mock_run.side_effect = OSError("git not found")
+        assert create_remote_branch("owner/repo", "newbranch") is False
 
     @patch("devlaunch.dl._get_git_work_dir")
     @patch("subprocess.run")
     def test_create_remote_branch_uses_cache_dir(self, mock_run, mock_git_dir):
         """Test branch creation uses cache directory for git operations."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_dir = pathlib.Path(tmpdir)
-            mock_git_dir.return_value = cache_dir
-            mock_run.return_value = MagicMock(returncode=0)
-            result = create_remote_branch("owner/repo", "newbranch")
-            assert result is True
-            # Should have called git init, git fetch, git push
-            assert mock_run.call_count == 3
-            # All calls should use the cache directory
-            for call in mock_run.call_args_list:
-                assert call[1]["cwd"] == cache_dir
+        mock_git_dir.return_value = FAKE_GIT_DIR
+        mock_run.return_value = SUCCESS
+        result = create_remote_branch("owner/repo", "newbranch")
+        assert result is True
+        # Should have called git init, git fetch, git push, all in the cache directory
+        assert [call.kwargs["cwd"] for call in mock_run.call_args_list] == [FAKE_GIT_DIR] * 3
 
     @patch("devlaunch.dl._get_git_work_dir")
     @patch("subprocess.run")
@@ -661,70 +667,65 @@ class TestRemoteBranchFunctions:
             # Create .git directory to simulate existing repo
             (cache_dir / ".git").mkdir()
             mock_git_dir.return_value = cache_dir
-            mock_run.return_value = MagicMock(returncode=0)
+            mock_run.return_value = SUCCESS
             result = create_remote_branch("owner/repo", "newbranch")
             assert result is True
             # Should only call git fetch, git push (no init)
-            assert mock_run.call_count == 2
-            assert mock_run.call_args_list[0][0][0][0:2] == ["git", "fetch"]
-            assert mock_run.call_args_list[1][0][0][0:2] == ["git", "push"]
+            fetch_args, push_args = (call.args[0] for call in mock_run.call_args_list)
+            assert fetch_args[0:2] == ["git", "fetch"]
+            assert push_args[0:2] == ["git", "push"]
 
     @patch("devlaunch.dl._get_git_work_dir")
     @patch("subprocess.run")
     def test_create_remote_branch_git_init_fails(self, mock_run, mock_git_dir):
         """Test branch creation fails gracefully if git init fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mock_git_dir.return_value = pathlib.Path(tmpdir)
-            mock_run.return_value = MagicMock(returncode=1, stderr="init failed")
-            result = create_remote_branch("owner/repo", "newbranch")
-            assert result is False
-            # Should only call git init
-            assert mock_run.call_count == 1
+        mock_git_dir.return_value = FAKE_GIT_DIR
+        mock_run.return_value = MagicMock(returncode=1, stderr="init failed")
+        result = create_remote_branch("owner/repo", "newbranch")
+        assert result is False
+        # Should only call git init
+        assert mock_run.call_count == 1
 
     @patch("devlaunch.dl._get_git_work_dir")
     @patch("subprocess.run")
     def test_create_remote_branch_fetch_fails(self, mock_run, mock_git_dir, caplog):
         """Test branch creation fails gracefully if git fetch fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mock_git_dir.return_value = pathlib.Path(tmpdir)
-            mock_run.side_effect = [
-                MagicMock(returncode=0),  # git init
-                MagicMock(returncode=1, stderr="fetch failed"),  # git fetch
-            ]
-            result = create_remote_branch("owner/repo", "newbranch")
-            assert result is False
-            assert mock_run.call_count == 2
-            assert "Failed to fetch" in caplog.text
+        mock_git_dir.return_value = FAKE_GIT_DIR
+        mock_run.side_effect = [
+            SUCCESS,  # git init
+            MagicMock(returncode=1, stderr="fetch failed"),  # git fetch
+        ]
+        result = create_remote_branch("owner/repo", "newbranch")
+        assert result is False
+        assert mock_run.call_count == 2
+        assert "Failed to fetch" in caplog.text
 
     @patch("devlaunch.dl._get_git_work_dir")
     @patch("subprocess.run")
     def test_create_remote_branch_ssh_auth_fails(self, mock_run, mock_git_dir, caplog):
         """Test branch creation gives helpful error when SSH auth fails."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mock_git_dir.return_value = pathlib.Path(tmpdir)
-            # git init succeeds, git fetch succeeds, git push fails with SSH error
-            mock_run.side_effect = [
-                MagicMock(returncode=0),  # git init
-                MagicMock(returncode=0),  # git fetch
-                MagicMock(returncode=128, stderr="git@github.com: Permission denied (publickey)."),
-            ]
-            result = create_remote_branch("owner/repo", "newbranch")
-            assert result is False
-            assert "SSH authentication failed" in caplog.text
-            assert "configure SSH keys" in caplog.text
+        mock_git_dir.return_value = FAKE_GIT_DIR
+        # git init succeeds, git fetch succeeds, git push fails with SSH error
+        mock_run.side_effect = [
+            SUCCESS,  # git init
+            SUCCESS,  # git fetch
+            MagicMock(returncode=128, stderr="git@github.com: Permission denied (publickey)."),
+        ]
+        result = create_remote_branch("owner/repo", "newbranch")
+        assert result is False
+        assert "SSH authentication failed" in caplog.text
+        assert "configure SSH keys" in caplog.text
 
     @patch("devlaunch.dl._get_git_work_dir")
     @patch("subprocess.run")
     def test_create_remote_branch_uses_ssh_url(self, mock_run, mock_git_dir):
         """Test branch creation uses SSH URL for push."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mock_git_dir.return_value = pathlib.Path(tmpdir)
-            mock_run.return_value = MagicMock(returncode=0)
-            create_remote_branch("owner/repo", "newbranch")
-            # Check that git push (3rd call) was called with SSH URL
-            push_call = mock_run.call_args_list[2]
-            push_args = push_call[0][0]
-            assert "git@github.com:owner/repo.git" in push_args
+        mock_git_dir.return_value = FAKE_GIT_DIR
+        mock_run.return_value = SUCCESS
+        create_remote_branch("owner/repo", "newbranch")
+        # Check that git push (3rd call) was called with SSH URL
+        _, _, push_call = mock_run.call_args_list
+        assert "git@github.com:owner/repo.git" in push_call.args[0]
 
 
 class TestDiscoverReposFromWorkspaces:
@@ -808,8 +809,6 @@ class TestGetVersion:
     @patch("devlaunch.dl.pkg_version")
     def test_get_version_package_not_found(self, mock_pkg_version):
         """Test get_version returns 'unknown' when package not found."""
-        from importlib.metadata import PackageNotFoundError
-
         mock_pkg_version.side_effect = PackageNotFoundError("devlaunch")
         version = get_version()
         assert version == "unknown"
@@ -818,52 +817,34 @@ class TestGetVersion:
 class TestSpecToWorkspaceId:
     """Tests for spec_to_workspace_id function."""
 
-    def test_owner_repo_full_url_sanitized(self):
-        """Test owner/repo generates full sanitized URL as workspace ID."""
-        assert spec_to_workspace_id("blooop/devlaunch") == "github-com-blooop-devlaunch"
-
-    def test_owner_repo_with_branch_uses_branch(self):
-        """Test owner/repo@branch uses sanitized branch as workspace ID."""
-        assert spec_to_workspace_id("blooop/devlaunch@main") == "main"
-
-    def test_owner_repo_with_feature_branch(self):
-        """Test owner/repo@feature/branch sanitizes branch name."""
-        assert spec_to_workspace_id("owner/repo@feature/my-branch") == "feature-my-branch"
-
-    def test_owner_repo_with_uppercase_branch(self):
-        """Test branch name is lowercased."""
-        assert spec_to_workspace_id("Owner/Repo@Feature/MyBranch") == "feature-mybranch"
-
-    def test_github_url_sanitized(self):
-        """Test github.com/owner/repo generates sanitized ID."""
-        assert spec_to_workspace_id("github.com/loft-sh/devpod") == "github-com-loft-sh-devpod"
-
-    def test_https_url_strips_protocol(self):
-        """Test https URL strips protocol and sanitizes."""
-        assert spec_to_workspace_id("https://github.com/owner/repo") == "github-com-owner-repo"
-
-    def test_url_with_git_suffix_strips_it(self):
-        """Test URL with .git suffix strips it."""
-        assert spec_to_workspace_id("github.com/owner/repo.git") == "github-com-owner-repo"
-
-    def test_underscore_removed_from_repo(self):
-        """Test underscores are removed from repo-based workspace ID."""
-        assert spec_to_workspace_id("blooop/test_renv") == "github-com-blooop-testrenv"
-
-    def test_branch_allows_multiple_workspaces(self):
-        """Test different branches get different workspace IDs."""
-        assert spec_to_workspace_id("blooop/test_renv@nb12") == "nb12"
-        assert spec_to_workspace_id("blooop/test_renv@nb14") == "nb14"
-        # Different branches = different IDs = can be open simultaneously
-
-    def test_path_extracts_directory_name(self):
-        """Test path extracts directory name."""
-        result = spec_to_workspace_id("./my-project")
-        assert result == "my-project"
-
-    def test_existing_workspace_id(self):
-        """Test existing workspace ID is returned as-is."""
-        assert spec_to_workspace_id("myworkspace") == "myworkspace"
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [
+            # owner/repo generates full sanitized URL as workspace ID
+            ("blooop/devlaunch", "github-com-blooop-devlaunch"),
+            # owner/repo@branch uses sanitized branch as workspace ID
+            ("blooop/devlaunch@main", "main"),
+            ("owner/repo@feature/my-branch", "feature-my-branch"),
+            # Branch name is lowercased
+            ("Owner/Repo@Feature/MyBranch", "feature-mybranch"),
+            # URLs strip protocol and .git suffix and are sanitized
+            ("github.com/loft-sh/devpod", "github-com-loft-sh-devpod"),
+            ("https://github.com/owner/repo", "github-com-owner-repo"),
+            ("github.com/owner/repo.git", "github-com-owner-repo"),
+            # Underscores are removed from repo-based workspace IDs
+            ("blooop/test_renv", "github-com-blooop-testrenv"),
+            # Different branches = different IDs = can be open simultaneously
+            ("blooop/test_renv@nb12", "nb12"),
+            ("blooop/test_renv@nb14", "nb14"),
+            # Paths use the directory name
+            ("./my-project", "my-project"),
+            # Existing workspace IDs are returned as-is
+            ("myworkspace", "myworkspace"),
+        ],
+    )
+    def test_spec_to_workspace_id(self, spec, expected):
+        """Test each spec form maps to the expected workspace ID."""
+        assert spec_to_workspace_id(spec) == expected
 
 
 class TestMakeWorktreeWorkspaceId:
@@ -887,14 +868,9 @@ class TestMakeWorktreeWorkspaceId:
         assert result.startswith("owner-repo-")
 
     def test_max_len_respected(self):
-        """Test max_len is respected."""
-        result = make_worktree_workspace_id("owner", "repo", "main", max_len=20)
-        assert len(result) <= 20
-
-    def test_default_max_len(self):
-        """Test default max_len is 50."""
-        result = make_worktree_workspace_id("owner", "repo", "main")
-        assert len(result) <= 50
+        """Test explicit and default (50) max_len limits are respected."""
+        assert len(make_worktree_workspace_id("owner", "repo", "main", max_len=20)) <= 20
+        assert len(make_worktree_workspace_id("owner", "repo", "main")) <= 50
 
     def test_preserves_owner_repo(self):
         """Test owner and repo are always preserved."""
@@ -902,6 +878,28 @@ class TestMakeWorktreeWorkspaceId:
         assert result.startswith("blooop-devlaunch-")
 
 
+class TestGetWorktreeContainerPath:
+    """Tests for get_worktree_container_path function."""
+
+    def test_basic_path(self):
+        """Test worktree path is nested under the mounted base repo."""
+        assert get_worktree_container_path("blooop-bencher-main", "main") == EXPECTED_MAIN_WORKDIR
+
+    def test_branch_with_slash_sanitized(self):
+        """Test branch names with slashes map to a single path component."""
+        result = get_worktree_container_path("blooop-bencher-main", "feature/my-branch")
+        assert result == EXPECTED_FEATURE_WORKDIR
+
+    def test_branch_lowercased(self):
+        """Test branch names are lowercased like workspace IDs."""
+        assert get_worktree_container_path("blooop-bencher-main", "MAIN") == EXPECTED_MAIN_WORKDIR
+
+    def test_repeated_calls_cached(self):
+        """Test the same workspace/branch pair is only sanitized once."""
+        first = get_worktree_container_path("blooop-bencher-main", "feature/my-branch")
+        assert get_worktree_container_path("blooop-bencher-main", "feature/my-branch") is first
+
+
 class TestCacheFunctions:
     """Tests for cache read/write functions."""
 
@@ -1021,19 +1019,20 @@ class TestRunDevpod:
     @patch("devlaunch.dl.subprocess.run")
     def test_run_devpod_basic(self, mock_run):
         """Test basic devpod command execution."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = SUCCESS
         result = run_devpod(["list"])
         mock_run.assert_called_once()
         assert result.returncode == 0
 
+    @patch("devlaunch.dl._DEVPOD_BIN", "/opt/bin/devpod")
     @patch("devlaunch.dl.subprocess.run")
     def test_run_devpod_capture(self, mock_run):
-        """Test devpod command with capture."""
+        """Test devpod command with capture runs the resolved devpod binary."""
         mock_run.return_value = MagicMock(returncode=0, stdout="output")
         run_devpod(["list"], capture=True)
-        mock_run.assert_called_once()
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["capture_output"] is True
+        mock_run.assert_called_once_with(
+            ["/opt/bin/devpod", "list"], capture_output=True, text=True, check=False
+        )
 
 
 class TestWorkspaceOperations:
@@ -1042,7 +1041,7 @@ class TestWorkspaceOperations:
     @patch("devlaunch.dl.run_devpod")
     def test_workspace_stop(self, mock_run):
         """Test workspace_stop calls devpod stop."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = SUCCESS
         result = workspace_stop("myworkspace")
         mock_run.assert_called_once_with(["stop", "myworkspace"])
         assert result == 0
@@ -1050,12 +1049,45 @@ class TestWorkspaceOperations:
     @patch("devlaunch.dl.run_devpod")
     def test_workspace_delete(self, mock_run):
         """Test workspace_delete calls devpod delete."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = SUCCESS
         result = workspace_delete("myworkspace")
         mock_run.assert_called_once_with(["delete", "myworkspace"])
         assert result == 0
 
 
+class TestWorkspaceSsh:
+    """Tests for workspace_ssh argv assembly."""
+
+    @pytest.fixture
+    def devpod_args(self, monkeypatch):
+        """Capture the argv passed to run_devpod in a plain list."""
+        captured = []
+
+        def fake_run_devpod(args, _capture=False):
+            captured.extend(args)
+            return SUCCESS
+
+        monkeypatch.setattr("devlaunch.dl.run_devpod", fake_run_devpod)
+        return captured
+
+    def test_plain_shell(self, devpod_args):
+        """Test attaching without options only names the workspace."""
+        assert workspace_ssh("myws") == 0
+        assert devpod_args == ["ssh", "myws"]
+
+    def test_workdir_and_command(self, devpod_args):
+        """Test workdir and command are passed as separate devpod flags."""
+        workspace_ssh("myws", "make test", workdir="/workspaces/myws/.worktrees/main")
+        assert devpod_args == [
+            "ssh",
+            "myws",
+            "--workdir",
+            "/workspaces/myws/.worktrees/main",
+            "--command",
+            "make test",
+        ]
+
+
 class TestPrintFunctions:
     """Tests for print functions."""
 
@@ -1086,9 +1118,15 @@ class TestPrintFunctions:
         assert "No workspaces found" in captured.out
 
 
+@pytest.mark.xdist_group("main_cli")
 class TestMainCLI:
     """Tests for main() CLI entry point."""
 
+    @pytest.fixture(autouse=True)
+    def _no_cache_update(self, monkeypatch):
+        """Keep main() from spawning the background completion cache update."""
+        monkeypatch.setattr("devlaunch.dl.update_cache_background", MagicMock())
+
     def test_main_help_flag(self, capsys):
         """Test --help flag shows help."""
         with patch.object(sys, "argv", ["dl", "--help"]):
@@ -1202,7 +1240,7 @@ class TestMainCLI:
     def test_main_workspace_code(self, mock_up, mock_ids):
         """Test workspace code command."""
         mock_ids.return_value = ["myws"]
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = SUCCESS
         with patch.object(sys, "argv", ["dl", "myws", "code"]):
             result = main()
         assert result == 0
@@ -1214,7 +1252,7 @@ class TestMainCLI:
     def test_main_workspace_recreate(self, mock_ssh, mock_up, mock_ids):
         """Test workspace recreate command."""
         mock_ids.return_value = ["myws"]
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = SUCCESS
         mock_ssh.return_value = 0
         with patch.object(sys, "argv", ["dl", "myws", "recreate"]):
             result = main()
@@ -1229,7 +1267,7 @@ class TestMainCLI:
         """Test workspace restart command."""
         mock_ids.return_value = ["myws"]
         mock_stop.return_value = 0
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = SUCCESS
         mock_ssh.return_value = 0
         with patch.object(sys, "argv", ["dl", "myws", "restart"]):
             result = main()
@@ -1243,7 +1281,7 @@ class TestMainCLI:
     def test_main_workspace_reset(self, mock_ssh, mock_up, mock_ids):
         """Test workspace reset command."""
         mock_ids.return_value = ["myws"]
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = SUCCESS
         mock_ssh.return_value = 0
         with patch.object(sys, "argv", ["dl", "myws", "reset"]):
             result = main()
@@ -1271,11 +1309,10 @@ class TestMainCLI:
     @patch("devlaunch.dl.get_workspace_ids")
     @patch("devlaunch.dl.workspace_up")
     @patch("devlaunch.dl.workspace_ssh")
-    @patch("devlaunch.dl.update_cache_background")
-    def test_main_workspace_shell_command(self, _cache, mock_ssh, mock_up, mock_ids):
+    def test_main_workspace_shell_command(self, mock_ssh, mock_up, mock_ids):
         """Test running shell command with -- separator."""
         mock_ids.return_value = ["myws"]
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = SUCCESS
         mock_ssh.return_value = 0
         with patch.object(sys, "argv", ["dl", "myws", "--", "echo", "hello"]):
             result = main()
@@ -1285,11 +1322,10 @@ class TestMainCLI:
     @patch("devlaunch.dl.get_workspace_ids")
     @patch("devlaunch.dl.workspace_up")
     @patch("devlaunch.dl.workspace_ssh")
-    @patch("devlaunch.dl.update_cache_background")
-    def test_main_workspace_default(self, _cache, mock_ssh, mock_up, mock_ids):
+    def test_main_workspace_default(self, mock_ssh, mock_up, mock_ids):
         """Test default workspace start and attach."""
         mock_ids.return_value = ["myws"]
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = SUCCESS
         mock_ssh.return_value = 0
         with patch.object(sys, "argv", ["dl", "myws"]):
             result = main()
@@ -1303,16 +1339,15 @@ class TestMainCLI:
     @patch("devlaunch.dl.spec_to_workspace_id")
     @patch("devlaunch.dl.workspace_up")
     @patch("devlaunch.dl.workspace_ssh")
-    @patch("devlaunch.dl.update_cache_background")
     def test_main_new_workspace_from_repo(
-        self, _cache, mock_ssh, mock_up, mock_spec_id, mock_expand, mock_ids, mock_use_worktree
+        self, mock_ssh, mock_up, mock_spec_id, mock_expand, mock_ids, mock_use_worktree
     ):
         """Test creating workspace from owner/repo (DevPod backend)."""
         mock_use_worktree.return_value = False  # Use DevPod backend for this test
         mock_ids.return_value = []  # Not existing
         mock_expand.return_value = "github.com/owner/repo"
         mock_spec_id.return_value = "github-com-owner-repo"
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = SUCCESS
         mock_ssh.return_value = 0
         with patch.object(sys, "argv", ["dl", "owner/repo"]):
             result = main()
@@ -1323,48 +1358,50 @@ class TestMainCLI:
         )
         mock_ssh.assert_called_once_with("github-com-owner-repo", None)
 
-    @patch("devlaunch.dl.should_use_worktree_backend")
-    @patch("devlaunch.dl.get_workspace_ids")
-    @patch("devlaunch.dl.ensure_remote_branch")
-    @patch("devlaunch.dl.workspace_up")
-    @patch("devlaunch.dl.workspace_ssh")
-    @patch("devlaunch.dl.update_cache_background")
-    def test_main_new_workspace_from_repo_with_existing_branch(
-        self, _cache, mock_ssh, mock_up, mock_ensure, mock_ids, mock_use_worktree
-    ):
+    @patch.multiple(
+        "devlaunch.dl",
+        should_use_worktree_backend=DEFAULT,
+        get_workspace_ids=DEFAULT,
+        ensure_remote_branch=DEFAULT,
+        workspace_up=DEFAULT,
+        workspace_ssh=DEFAULT,
+    )
+    def test_main_new_workspace_from_repo_with_existing_branch(self, **mocks):
         """Test creating workspace from owner/repo@branch when branch exists."""
-        mock_use_worktree.return_value = False  # Use DevPod backend
-        mock_ids.return_value = []  # Not existing
-        mock_ensure.return_value = True  # Branch exists
-        mock_up.return_value = MagicMock(returncode=0)
-        mock_ssh.return_value = 0
+        mocks["should_use_worktree_backend"].return_value = False  # Use DevPod backend
+        mocks["get_workspace_ids"].return_value = []  # Not existing
+        mocks["ensure_remote_branch"].return_value = True  # Branch exists
+        mocks["workspace_up"].return_value = SUCCESS
+        mocks["workspace_ssh"].return_value = 0
         with patch.object(sys, "argv", ["dl", "owner/repo@main"]):
             result = main()
         assert result == 0
-        mock_ensure.assert_called_once_with("owner/repo", "main")
+        mocks["ensure_remote_branch"].assert_called_once_with("owner/repo", "main")
         # workspace_id is the branch name when branch is specified
-        mock_up.assert_called_once_with("git@github.com:owner/repo.git@main", workspace_id="main")
+        mocks["workspace_up"].assert_called_once_with(
+            "git@github.com:owner/repo.git@main", workspace_id="main"
+        )
 
-    @patch("devlaunch.dl.should_use_worktree_backend")
-    @patch("devlaunch.dl.get_workspace_ids")
-    @patch("devlaunch.dl.ensure_remote_branch")
-    @patch("devlaunch.dl.workspace_up")
-    @patch("devlaunch.dl.workspace_ssh")
-    @patch("devlaunch.dl.update_cache_background")
-    def test_main_new_workspace_creates_branch(
-        self, _cache, mock_ssh, mock_up, mock_ensure, mock_ids, mock_use_worktree
-    ):
+    @patch.multiple(
+        "devlaunch.dl",
+        should_use_worktree_backend=DEFAULT,
+        get_workspace_ids=DEFAULT,
+        ensure_remote_branch=DEFAULT,
+        workspace_up=DEFAULT,
+        workspace_ssh=DEFAULT,
+    )
+    def test_main_new_workspace_creates_branch(self, **mocks):
         """Test creating workspace from owner/repo@newbranch creates the branch."""
-        mock_use_worktree.return_value = False  # Use DevPod backend
-        mock_ids.return_value = []  # Not existing
-        mock_ensure.return_value = True  # Branch created successfully
-        mock_up.return_value = MagicMock(returncode=0)
-        mock_ssh.return_value = 0
+        mocks["should_use_worktree_backend"].return_value = False  # Use DevPod backend
+        mocks["get_workspace_ids"].return_value = []  # Not existing
+        mocks["ensure_remote_branch"].return_value = True  # Branch created successfully
+        mocks["workspace_up"].return_value = SUCCESS
+        mocks["workspace_ssh"].return_value = 0
         with patch.object(sys, "argv", ["dl", "owner/repo@newbranch"]):
             result = main()
         assert result == 0
-        mock_ensure.assert_called_once_with("owner/repo", "newbranch")
-        mock_up.assert_called_once_with(
+        mocks["ensure_remote_branch"].assert_called_once_with("owner/repo", "newbranch")
+        mocks["workspace_up"].assert_called_once_with(
             "git@github.com:owner/repo.git@newbranch", workspace_id="newbranch"
         )
 
@@ -1381,38 +1418,37 @@ class TestMainCLI:
         assert result == 1
         mock_ensure.assert_called_once_with("owner/repo", "newbranch")
 
-    @patch("devlaunch.dl.should_use_worktree_backend")
-    @patch("devlaunch.dl.get_workspace_ids")
-    @patch("devlaunch.dl.ensure_remote_branch")
-    @patch("devlaunch.dl.workspace_up")
-    @patch("devlaunch.dl.workspace_ssh")
-    @patch("devlaunch.dl.update_cache_background")
-    def test_main_feature_branch_with_slash(
-        self, _cache, mock_ssh, mock_up, mock_ensure, mock_ids, mock_use_worktree
-    ):
+    @patch.multiple(
+        "devlaunch.dl",
+        should_use_worktree_backend=DEFAULT,
+        get_workspace_ids=DEFAULT,
+        ensure_remote_branch=DEFAULT,
+        workspace_up=DEFAULT,
+        workspace_ssh=DEFAULT,
+    )
+    def test_main_feature_branch_with_slash(self, **mocks):
         """Test creating workspace with feature/branch style branch name."""
-        mock_use_worktree.return_value = False  # Use DevPod backend
-        mock_ids.return_value = []
-        mock_ensure.return_value = True
-        mock_up.return_value = MagicMock(returncode=0)
-        mock_ssh.return_value = 0
+        mocks["should_use_worktree_backend"].return_value = False  # Use DevPod backend
+        mocks["get_workspace_ids"].return_value = []
+        mocks["ensure_remote_branch"].return_value = True
+        mocks["workspace_up"].return_value = SUCCESS
+        mocks["workspace_ssh"].return_value = 0
         with patch.object(sys, "argv", ["dl", "owner/repo@feature/my-feature"]):
             result = main()
         assert result == 0
-        mock_ensure.assert_called_once_with("owner/repo", "feature/my-feature")
+        mocks["ensure_remote_branch"].assert_called_once_with("owner/repo", "feature/my-feature")
         # Branch name is sanitized: feature/my-feature -> feature-my-feature
-        mock_up.assert_called_once_with(
+        mocks["workspace_up"].assert_called_once_with(
             "git@github.com:owner/repo.git@feature/my-feature", workspace_id="feature-my-feature"
         )
 
     @patch("devlaunch.dl.get_workspace_ids")
     @patch("devlaunch.dl.workspace_up")
     @patch("devlaunch.dl.workspace_ssh")
-    @patch("devlaunch.dl.update_cache_background")
-    def test_main_existing_workspace_no_branch_check(self, _cache, mock_ssh, mock_up, mock_ids):
+    def test_main_existing_workspace_no_branch_check(self, mock_ssh, mock_up, mock_ids):
         """Test existing workspace doesn't trigger branch check."""
         mock_ids.return_value = ["myworkspace"]  # Existing
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = SUCCESS
         mock_ssh.return_value = 0
         # Use existing workspace name (not owner/repo format)
         with patch.object(sys, "argv", ["dl", "myworkspace"]):
@@ -1425,14 +1461,13 @@ class TestMainCLI:
     @patch("devlaunch.dl.get_workspace_ids")
     @patch("devlaunch.dl.workspace_up")
     @patch("devlaunch.dl.workspace_ssh")
-    @patch("devlaunch.dl.update_cache_background")
     def test_main_repo_without_branch_no_branch_check(
-        self, _cache, mock_ssh, mock_up, mock_ids, mock_use_worktree
+        self, mock_ssh, mock_up, mock_ids, mock_use_worktree
     ):
         """Test owner/repo without @branch doesn't trigger branch check."""
         mock_use_worktree.return_value = False  # Use DevPod backend for this test
         mock_ids.return_value = []
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = SUCCESS
         mock_ssh.return_value = 0
         with patch.object(sys, "argv", ["dl", "owner/repo"]):
             with patch("devlaunch.dl.ensure_remote_branch") as mock_ensure:
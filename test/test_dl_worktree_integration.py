@@ -2,12 +2,19 @@
 # pylint: disable=redefined-outer-name,unused-argument,unused-variable
 
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
-from devlaunch.dl import main, should_use_worktree_backend, workspace_up_worktree
+from devlaunch.dl import (
+    get_worktree_managers,
+    main,
+    should_use_worktree_backend,
+    workspace_up_worktree,
+)
+from devlaunch.worktree.config import WorktreeConfig
 from devlaunch.worktree.models import WorktreeInfo
 
 
@@ -46,6 +53,32 @@ def mock_managers(mock_workspace_manager):
     )
 
 
+@dataclass
+class DlMocks:
+    """Mocks installed over devlaunch.dl for main() flow tests."""
+
+    get_worktree_managers: Mock
+    get_workspace_ids: Mock
+    workspace_ssh: Mock
+    workspace_stop: Mock
+    update_cache_background: Mock
+
+
+@pytest.fixture
+def dl_mocks(monkeypatch, mock_managers):
+    """Patch the devpod-facing helpers main() calls, once per test."""
+    mocks = DlMocks(
+        get_worktree_managers=Mock(return_value=mock_managers),
+        get_workspace_ids=Mock(return_value=[]),
+        workspace_ssh=Mock(return_value=0),
+        workspace_stop=Mock(return_value=0),
+        update_cache_background=Mock(),
+    )
+    for name, mock in vars(mocks).items():
+        monkeypatch.setattr(f"devlaunch.dl.{name}", mock)
+    return mocks
+
+
 class TestShouldUseWorktreeBackend:
     """Test the should_use_worktree_backend function."""
 
@@ -75,83 +108,146 @@ class TestShouldUseWorktreeBackend:
         assert should_use_worktree_backend("https://github.com/owner/repo.git") is True
 
 
+class TestGetWorktreeManagers:
+    """Test the get_worktree_managers function."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Isolate each test from managers cached by earlier calls."""
+        get_worktree_managers.cache_clear()
+        yield
+        get_worktree_managers.cache_clear()
+
+    @patch("devlaunch.worktree.MetadataStorage")
+    @patch("devlaunch.worktree.get_worktree_config")
+    def test_managers_built_once(self, mock_get_config, mock_storage_cls, tmp_path):
+        """Test repeated calls reuse the managers instead of reloading config."""
+        mock_get_config.return_value = WorktreeConfig(repos_dir=tmp_path)
+
+        first = get_worktree_managers()
+        second = get_worktree_managers()
+
+        assert first is second
+        mock_get_config.assert_called_once()
+        mock_storage_cls.assert_called_once()
+
+
 class TestWorkspaceUpWorktree:
     """Test the workspace_up_worktree function."""
 
-    @patch("devlaunch.dl.get_worktree_managers")
-    def test_creates_workspace(self, mock_get_managers, mock_managers):
-        """Test that workspace_up_worktree creates a workspace."""
-        mock_get_managers.return_value = mock_managers
-        _, _, mock_ws_manager, _, _ = mock_managers
+    @pytest.fixture(autouse=True)
+    def _use_mock_managers(self, monkeypatch, mock_managers):
+        """Serve the mock managers from get_worktree_managers."""
+        monkeypatch.setattr("devlaunch.dl.get_worktree_managers", Mock(return_value=mock_managers))
 
+    def test_creates_workspace(self, mock_workspace_manager):
+        """Test that workspace_up_worktree creates a workspace."""
         result = workspace_up_worktree("owner", "repo", "main")
 
         assert result.returncode == 0
-        mock_ws_manager.create_workspace.assert_called_once()
-        call_kwargs = mock_ws_manager.create_workspace.call_args.kwargs
-        assert call_kwargs["owner"] == "owner"
-        assert call_kwargs["repo"] == "repo"
-        assert call_kwargs["branch"] == "main"
-
-    @patch("devlaunch.dl.get_worktree_managers")
-    def test_with_custom_workspace_id(self, mock_get_managers, mock_managers):
-        """Test workspace creation with custom ID."""
-        mock_get_managers.return_value = mock_managers
-        _, _, mock_ws_manager, _, _ = mock_managers
+        mock_workspace_manager.create_workspace.assert_called_once_with(
+            owner="owner",
+            repo="repo",
+            branch="main",
+            workspace_id=None,
+            remote_url=ANY,
+            ide=None,
+            share_container=False,
+        )
 
+    def test_with_custom_workspace_id(self, mock_workspace_manager):
+        """Test workspace creation with custom ID."""
         workspace_up_worktree("owner", "repo", "main", workspace_id="custom-id")
 
-        call_kwargs = mock_ws_manager.create_workspace.call_args.kwargs
+        call_kwargs = mock_workspace_manager.create_workspace.call_args.kwargs
         assert call_kwargs["workspace_id"] == "custom-id"
 
-    @patch("devlaunch.dl.get_worktree_managers")
-    def test_with_ide(self, mock_get_managers, mock_managers):
+    def test_with_ide(self, mock_workspace_manager):
         """Test workspace creation with IDE specification."""
-        mock_get_managers.return_value = mock_managers
-        _, _, mock_ws_manager, _, _ = mock_managers
-
         workspace_up_worktree("owner", "repo", "main", ide="vscode")
 
-        call_kwargs = mock_ws_manager.create_workspace.call_args.kwargs
+        call_kwargs = mock_workspace_manager.create_workspace.call_args.kwargs
         assert call_kwargs["ide"] == "vscode"
 
 
+@pytest.mark.xdist_group("main_worktree")
 class TestMainWithWorktreeBackend:
     """Test main() function with worktree backend."""
 
-    @patch("devlaunch.dl.get_worktree_managers")
-    @patch("devlaunch.dl.should_use_worktree_backend")
-    @patch("devlaunch.dl.workspace_ssh")
-    @patch("devlaunch.dl.update_cache_background")
-    def test_main_uses_worktree_backend(
-        self, mock_cache, mock_ssh, mock_use_worktree, mock_get_managers, mock_managers
+    @pytest.mark.parametrize(
+        "argv,expected_ide,expected_ssh",
+        [
+            (["owner/repo@main"], None, (None,)),
+            (["owner/repo@main", "restart"], None, ()),
+            (["owner/repo@main", "--", "make", "test"], None, ("make test",)),
+            (["owner/repo@main", "code"], "vscode", None),
+        ],
+        ids=["default", "restart", "shell-command", "code"],
+    )
+    def test_main_worktree_flows(
+        self, dl_mocks, mock_workspace_manager, argv, expected_ide, expected_ssh
     ):
-        """Test main uses worktree backend when should_use_worktree_backend returns True."""
-        mock_use_worktree.return_value = True
-        mock_get_managers.return_value = mock_managers
-        mock_ssh.return_value = 0
+        """Test each main() flow creates the worktree workspace and attaches in the worktree."""
+        with patch.object(sys, "argv", ["dl", *argv]):
+            result = main()
 
-        with patch.object(sys, "argv", ["dl", "owner/repo@main"]):
+        assert result == 0
+        mock_workspace_manager.create_workspace.assert_called_once()
+        call_kwargs = mock_workspace_manager.create_workspace.call_args.kwargs
+        assert call_kwargs["ide"] == expected_ide
+        if expected_ssh is None:
+            dl_mocks.workspace_ssh.assert_not_called()
+        else:
+            dl_mocks.workspace_ssh.assert_called_once_with(
+                "owner-repo-main",
+                *expected_ssh,
+                workdir="/workspaces/owner-repo-main/.worktrees/main",
+            )
+
+    def test_main_resolves_default_branch_once(self, dl_mocks, mock_managers):
+        """Test main looks up the default branch once and reuses it for up and ssh."""
+        mock_repo_manager = mock_managers[0]
+        mock_repo_manager.get_default_branch.return_value = "develop"
+
+        with patch.object(sys, "argv", ["dl", "owner/repo"]):
             result = main()
 
         assert result == 0
-        mock_use_worktree.assert_called()
+        mock_repo_manager.get_default_branch.assert_called_once_with("owner", "repo")
+        dl_mocks.workspace_ssh.assert_called_once_with(
+            "owner-repo-develop", None, workdir="/workspaces/owner-repo-develop/.worktrees/develop"
+        )
 
-    @patch("devlaunch.dl.get_worktree_managers")
-    @patch("devlaunch.dl.should_use_worktree_backend")
-    def test_main_worktree_backend_failure(
-        self, mock_use_worktree, mock_get_managers, mock_managers
-    ):
+    def test_main_shared_stop_skips_default_branch(self, dl_mocks, mock_managers):
+        """Test a shared stop never looks up a branch it has no use for."""
+        mock_repo_manager = mock_managers[0]
+
+        with patch.object(sys, "argv", ["dl", "--shared", "owner/repo", "stop"]):
+            result = main()
+
+        assert result == 0
+        mock_repo_manager.get_default_branch.assert_not_called()
+        dl_mocks.workspace_stop.assert_called_once_with("owner-repo")
+
+    @pytest.mark.parametrize("exit_code", [1, 2, 127, 255])
+    def test_main_returns_ssh_exit_code(self, dl_mocks, exit_code):
+        """Test main propagates a non-zero exit code from the workspace shell."""
+        dl_mocks.workspace_ssh.return_value = exit_code
+
+        with patch.object(sys, "argv", ["dl", "owner/repo@main"]):
+            result = main()
+
+        assert result == exit_code
+
+    def test_main_worktree_backend_failure(self, dl_mocks, mock_workspace_manager):
         """Test main handles worktree backend failures."""
-        mock_use_worktree.return_value = True
-        _, _, mock_ws_manager, _, _ = mock_managers
-        mock_ws_manager.create_workspace.side_effect = RuntimeError("Clone failed")
-        mock_get_managers.return_value = mock_managers
+        mock_workspace_manager.create_workspace.side_effect = RuntimeError("Clone failed")
 
         with patch.object(sys, "argv", ["dl", "owner/repo@main"]):
             result = main()
 
         assert result == 1
+        dl_mocks.workspace_ssh.assert_not_called()
 
 
 class TestWorktreeBackendEdgeCases:
@@ -1,6 +1,7 @@
 """Edge case tests for workspace manager."""
 # pylint: disable=redefined-outer-name,unused-argument,protected-access,unused-variable
 
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
@@ -49,7 +50,7 @@ class TestWorkspaceManagerCreateWorkspace:
     def test_create_workspace_with_lock(self, workspace_manager, mock_worktree_manager):
         """Test that workspace creation uses file locking."""
         with patch("devlaunch.worktree.workspace_manager.run_devpod") as mock_devpod:
-            mock_devpod.return_value = MagicMock(returncode=0)
+            mock_devpod.return_value = Mock(spec_set=["returncode"], returncode=0)
 
             result, output = workspace_manager.create_workspace(
                 "owner", "repo", "main", remote_url="https://github.com/owner/repo.git"
@@ -63,7 +64,7 @@ class TestWorkspaceManagerCreateWorkspace:
     def test_create_workspace_failure_raises(self, workspace_manager, mock_worktree_manager):
         """Test workspace creation failure raises RuntimeError."""
         with patch("devlaunch.worktree.workspace_manager.run_devpod") as mock_devpod:
-            mock_devpod.return_value = MagicMock(returncode=1)
+            mock_devpod.return_value = Mock(spec_set=["returncode"], returncode=1)
 
             with pytest.raises(RuntimeError, match="DevPod failed"):
                 workspace_manager.create_workspace(
@@ -77,7 +78,7 @@ class TestWorkspaceManagerOperations:
     def test_start_workspace(self, workspace_manager):
         """Test starting a workspace."""
         with patch("devlaunch.worktree.workspace_manager.run_devpod") as mock_devpod:
-            mock_devpod.return_value = MagicMock(returncode=0)
+            mock_devpod.return_value = Mock(spec_set=["returncode"], returncode=0)
 
             result = workspace_manager.start_workspace("test-ws")
 
@@ -117,8 +118,6 @@ class TestWorkspaceManagerList:
 
     def test_list_workspaces_with_json(self, workspace_manager):
         """Test listing workspaces with JSON output."""
-        import json
-
         workspaces_json = json.dumps([{"id": "test-ws", "status": "running"}])
         with patch("devlaunch.worktree.workspace_manager.run_devpod") as mock_devpod:
             mock_devpod.return_value = MagicMock(returncode=0, stdout=workspaces_json)
@@ -137,7 +136,7 @@ class TestWorkspaceManagerConcurrency:
     ):
         """Test that workspace manager can create workspaces with locking."""
         with patch("devlaunch.worktree.workspace_manager.run_devpod") as mock_devpod:
-            mock_devpod.return_value = MagicMock(returncode=0)
+            mock_devpod.return_value = Mock(spec_set=["returncode"], returncode=0)
             result, _ = workspace_manager.create_workspace(
                 "owner",
                 "repo",
@@ -2,7 +2,7 @@
 
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 from devlaunch.dl import main, should_use_worktree_backend
 
@@ -68,7 +68,7 @@ class TestBackendFlagCLI:
         """Test --backend devpod flag forces DevPod backend."""
         mock_use_worktree.return_value = False
         mock_ids.return_value = []
-        mock_up.return_value = MagicMock(returncode=0)
+        mock_up.return_value = Mock(spec_set=["returncode"], returncode=0)
         mock_ssh.return_value = 0
 
         with patch.object(sys, "argv", ["dl", "--backend", "devpod", "owner/repo"]):
@@ -88,7 +88,7 @@ class TestBackendFlagCLI:
         """Test --backend worktree flag forces worktree backend."""
         mock_use_worktree.return_value = True
         mock_ids.return_value = []
-        mock_up_worktree.return_value = MagicMock(returncode=0)
+        mock_up_worktree.return_value = Mock(spec_set=["returncode"], returncode=0)
         mock_ssh.return_value = 0
 
         with patch.object(sys, "argv", ["dl", "--backend", "worktree", "owner/repo@main"]):
@@ -4,13 +4,18 @@
 import subprocess
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from devlaunch.worktree.branch_manager import BranchManager
 
 
+def _git_argv(mock_run):
+    """Return the git argv list from the most recent subprocess.run call."""
+    return mock_run.call_args.args[0]
+
+
 @pytest.fixture
 def branch_manager():
     """Create a branch manager for testing."""
@@ -33,20 +38,20 @@ class TestBranchManager:
     @patch("devlaunch.worktree.branch_manager.subprocess.run")
     def test_local_branch_exists_true(self, mock_run, branch_manager, temp_repo):
         """Test local_branch_exists returns True when branch exists."""
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = Mock(spec_set=["returncode"], returncode=0)
 
         result = branch_manager.local_branch_exists(temp_repo, "main")
 
         assert result is True
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        call_args = _git_argv(mock_run)
         assert "show-ref" in call_args
         assert "refs/heads/main" in call_args
 
     @patch("devlaunch.worktree.branch_manager.subprocess.run")
     def test_local_branch_exists_false(self, mock_run, branch_manager, temp_repo):
         """Test local_branch_exists returns False when branch doesn't exist."""
-        mock_run.return_value = MagicMock(returncode=1)
+        mock_run.return_value = Mock(spec_set=["returncode"], returncode=1)
 
         result = branch_manager.local_branch_exists(temp_repo, "nonexistent")
 
@@ -99,7 +104,7 @@ class TestBranchManager:
         branch_manager.create_local_branch(temp_repo, "new-branch")
 
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        call_args = _git_argv(mock_run)
         assert "branch" in call_args
         assert "new-branch" in call_args
         assert "HEAD" in call_args
@@ -111,7 +116,7 @@ class TestBranchManager:
 
         branch_manager.create_local_branch(temp_repo, "new-branch", "origin/main")
 
-        call_args = mock_run.call_args[0][0]
+        call_args = _git_argv(mock_run)
         assert "origin/main" in call_args
 
     @patch("devlaunch.worktree.branch_manager.subprocess.run")
@@ -142,7 +147,7 @@ class TestBranchManager:
         branch_manager.track_remote_branch(temp_repo, "main")
 
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        call_args = _git_argv(mock_run)
         assert "--set-upstream-to=origin/main" in call_args
         assert "main" in call_args
 
@@ -153,7 +158,7 @@ class TestBranchManager:
 
         branch_manager.track_remote_branch(temp_repo, "main", "upstream")
 
-        call_args = mock_run.call_args[0][0]
+        call_args = _git_argv(mock_run)
         assert "--set-upstream-to=upstream/main" in call_args
 
     @patch("devlaunch.worktree.branch_manager.subprocess.run")
@@ -202,7 +207,7 @@ class TestBranchManager:
         branch_manager.push_branch_to_remote(temp_repo, "new-branch")
 
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        call_args = _git_argv(mock_run)
         assert "push" in call_args
         assert "-u" in call_args
         assert "origin" in call_args
@@ -215,7 +220,7 @@ class TestBranchManager:
 
         branch_manager.push_branch_to_remote(temp_repo, "new-branch", ssh_key_path="/path/to/key")
 
-        call_kwargs = mock_run.call_args[1]
+        call_kwargs = mock_run.call_args.kwargs
         assert "env" in call_kwargs
         assert "GIT_SSH_COMMAND" in call_kwargs["env"]
         assert "/path/to/key" in call_kwargs["env"]["GIT_SSH_COMMAND"]
@@ -236,7 +241,7 @@ class TestBranchManager:
         branch_manager.checkout_branch(temp_repo, "main")
 
         mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        call_args = _git_argv(mock_run)
         assert "checkout" in call_args
         assert "main" in call_args
 
@@ -342,7 +347,7 @@ class TestCreateRemoteBranchViaSSH:
         result = branch_manager.create_remote_branch_via_ssh("owner", "repo", "new-branch")
 
         assert result is True
-        call_args = mock_run.call_args[0][0]
+        call_args = _git_argv(mock_run)
         assert "ssh" in call_args
         assert "git@github.com" in call_args
         assert "create" in call_args
@@ -359,7 +364,7 @@ class TestCreateRemoteBranchViaSSH:
         )
 
         assert result is True
-        call_args = mock_run.call_args[0][0]
+        call_args = _git_argv(mock_run)
         assert "-i" in call_args
         assert "/path/to/key" in call_args
 
@@ -103,6 +103,19 @@ class TestWorktreeConfig:
         assert config.fetch_interval == 3600
         assert config.auto_prune is True
         assert config.prune_after_days == 30
+        assert config.ssh_multiplex is False
+
+    def test_ssh_multiplex_round_trip(self):
+        """Test ssh_multiplex is only written when enabled and survives a round trip."""
+        config = WorktreeConfig(repos_dir=Path("/custom/repos"), ssh_multiplex=True)
+
+        data = config.to_dict()
+        assert data["worktree"]["ssh_multiplex"] is True
+        assert WorktreeConfig.from_dict(data).ssh_multiplex is True
+        assert (
+            "ssh_multiplex"
+            not in WorktreeConfig(repos_dir=Path("/custom/repos")).to_dict()["worktree"]
+        )
 
     def test_from_dict_partial(self):
         """Test creating config from partial dict uses defaults for missing values."""
@@ -136,7 +136,7 @@ class TestWorktreeManagerRemoval:
         mock_repo_manager.get_repo_path.return_value = temp_dir
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+            mock_run.return_value = Mock(spec_set=["returncode", "stdout"], returncode=0, stdout="")
 
             worktree_manager.remove_worktree("owner", "repo", "feature")
 
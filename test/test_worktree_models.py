@@ -30,6 +30,18 @@ class TestBaseRepository:
         assert repo.last_fetched == datetime(2024, 1, 1, 12, 0)
         assert repo.worktrees == ["feature-1", "feature-2"]
 
+    def test_key(self):
+        """Test BaseRepository storage key is owner/repo."""
+        repo = BaseRepository(
+            owner="test-owner",
+            repo="test-repo",
+            remote_url="https://github.com/test-owner/test-repo.git",
+            local_path=Path("/tmp/repos/test-owner/test-repo"),
+        )
+
+        assert repo.key == "test-owner/test-repo"
+        assert "key" not in repo.to_dict()
+
     def test_to_dict(self):
         """Test converting BaseRepository to dict."""
         repo = BaseRepository(
@@ -87,6 +99,16 @@ class TestBaseRepository:
         repo = BaseRepository.from_dict(data)
         assert repo.last_fetched is None
 
+    def test_uses_slots(self):
+        """Test BaseRepository instances have no per-instance __dict__."""
+        repo = BaseRepository(
+            owner="test-owner",
+            repo="test-repo",
+            remote_url="https://github.com/test-owner/test-repo.git",
+            local_path=Path("/tmp/repos/test-owner/test-repo"),
+        )
+        assert not hasattr(repo, "__dict__")
+
 
 class TestWorktreeInfo:
     """Tests for WorktreeInfo model."""
@@ -116,6 +138,19 @@ class TestWorktreeInfo:
         assert worktree.last_used == last_used
         assert worktree.devpod_workspace_id == "feature-branch-ws"
 
+    def test_key(self):
+        """Test WorktreeInfo storage key is owner/repo/branch."""
+        worktree = WorktreeInfo(
+            owner="test-owner",
+            repo="test-repo",
+            branch="feature/branch",
+            local_path=Path("/tmp/worktrees/test-owner/test-repo/feature-branch"),
+            workspace_id="feature-branch",
+        )
+
+        assert worktree.key == "test-owner/test-repo/feature/branch"
+        assert "key" not in worktree.to_dict()
+
     def test_to_dict(self):
         """Test converting WorktreeInfo to dict."""
         worktree = WorktreeInfo(
@@ -1,26 +1,33 @@
 """Tests for worktree repository manager."""
 # pylint: disable=redefined-outer-name,unused-argument,protected-access,unused-variable
 
+import asyncio
 import subprocess
-import tempfile
+import threading
+import uuid
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from devlaunch.worktree.config import WorktreeConfig
 from devlaunch.worktree.models import BaseRepository
 from devlaunch.worktree.repo_manager import RepositoryManager
 from devlaunch.worktree.storage import MetadataStorage
 
 
 @pytest.fixture
-def temp_dirs():
-    """Create temporary directories for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repos_dir = Path(tmpdir) / "repos"
-        metadata_path = Path(tmpdir) / "metadata.json"
-        repos_dir.mkdir()
-        yield repos_dir, metadata_path
+def temp_dirs(module_tmp_path):
+    """Create temporary directories for testing.
+
+    Each test gets its own unique subdirectory of the module-scoped temp dir,
+    so there is no cross-test state and no per-test tree removal.
+    """
+    test_dir = module_tmp_path / uuid.uuid4().hex
+    repos_dir = test_dir / "repos"
+    metadata_path = test_dir / "metadata.json"
+    repos_dir.mkdir(parents=True)
+    return repos_dir, metadata_path
 
 
 @pytest.fixture
@@ -86,6 +93,116 @@ class TestRepositoryManager:
         assert result.repo == "repo"
         assert mock_run.called
 
+    @staticmethod
+    def _make_clone(repo_manager, owner, repo, finished=True):
+        """Create an on-disk bare clone, with metadata only if the clone finished."""
+        repo_path = repo_manager.get_repo_path(owner, repo)
+        repo_path.mkdir(parents=True)
+        (repo_path / "HEAD").touch()
+        if finished:
+            repo_manager.storage.add_repository(
+                BaseRepository(
+                    owner=owner,
+                    repo=repo,
+                    remote_url=f"https://github.com/{owner}/{repo}.git",
+                    local_path=repo_path,
+                )
+            )
+        return repo_path
+
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_clone_repo_uses_reference(self, mock_run, repo_manager):
+        """Test clone borrows objects from a fork of the same repo under another owner."""
+        fork_path = self._make_clone(repo_manager, "upstream", "repo")
+
+        mock_run.return_value = MagicMock(stdout="refs/heads/main\n", stderr="", returncode=0)
+
+        repo_manager.clone_repo("owner", "repo", "https://github.com/owner/repo.git")
+
+        clone_args = mock_run.call_args_list[0][0][0]
+        assert "clone" in clone_args
+        assert "--reference-if-able" in clone_args
+        assert clone_args[clone_args.index("--reference-if-able") + 1] == str(fork_path)
+        assert "--dissociate" in clone_args
+
+    @pytest.mark.parametrize(
+        "other_owner,other_repo,finished",
+        [
+            (None, None, True),
+            ("owner", "unrelated", True),
+            ("upstream", "repo", False),
+        ],
+        ids=["no-other-clones", "same-owner-other-repo", "fork-still-cloning"],
+    )
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_clone_repo_without_usable_fork_has_no_reference(
+        self, mock_run, repo_manager, other_owner, other_repo, finished
+    ):
+        """Test clone skips unrelated repos and forks whose clone has not finished."""
+        if other_owner:
+            self._make_clone(repo_manager, other_owner, other_repo, finished)
+        mock_run.return_value = MagicMock(stdout="refs/heads/main\n", stderr="", returncode=0)
+
+        repo_manager.clone_repo("owner", "repo", "https://github.com/owner/repo.git")
+
+        clone_args = mock_run.call_args_list[0][0][0]
+        assert "--reference-if-able" not in clone_args
+
+    @patch("devlaunch.worktree.repo_manager.Path.home")
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_default_branch_lookup_and_clone_share_ssh_master(
+        self, mock_run, mock_home, repo_manager, temp_dirs, monkeypatch
+    ):
+        """Test ls-remote and clone both use the multiplexed SSH connection when enabled."""
+        monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+        mock_home.return_value = temp_dirs[0].parent
+        (temp_dirs[0].parent / ".ssh").mkdir()
+        repo_manager.ssh_multiplex = True
+        mock_run.return_value = MagicMock(
+            stdout="ref: refs/heads/develop\tHEAD\n", stderr="", returncode=0
+        )
+
+        assert repo_manager.get_default_branch("owner", "repo") == "develop"
+        repo_manager.clone_repo("owner", "repo", "git@github.com:owner/repo.git")
+
+        ls_remote_call, clone_call = mock_run.call_args_list[:2]
+        assert "ls-remote" in ls_remote_call.args[0]
+        assert "clone" in clone_call.args[0]
+        ssh_commands = {
+            call.kwargs["env"]["GIT_SSH_COMMAND"] for call in (ls_remote_call, clone_call)
+        }
+        assert len(ssh_commands) == 1
+        assert "ControlMaster=auto" in ssh_commands.pop()
+
+    @pytest.mark.parametrize(
+        "ssh_multiplex,remote_url",
+        [
+            (False, "git@github.com:owner/repo.git"),
+            (True, "https://github.com/owner/repo.git"),
+        ],
+    )
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_clone_inherits_env_unless_multiplexing_ssh(
+        self, mock_run, repo_manager, monkeypatch, ssh_multiplex, remote_url
+    ):
+        """Test clone leaves the ssh setup alone when off or for non-ssh remotes."""
+        monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+        repo_manager.ssh_multiplex = ssh_multiplex
+        mock_run.return_value = MagicMock(stdout="refs/heads/main\n", stderr="", returncode=0)
+
+        repo_manager.clone_repo("owner", "repo", remote_url)
+
+        assert mock_run.call_args_list[0].kwargs["env"] is None
+
+    def test_ssh_multiplex_follows_config(self, temp_dirs):
+        """Test ssh multiplexing is off by default and enabled from config."""
+        repos_dir, metadata_path = temp_dirs
+        storage = MetadataStorage(metadata_path)
+
+        assert RepositoryManager(repos_dir, storage).ssh_multiplex is False
+        config = WorktreeConfig(repos_dir=repos_dir, ssh_multiplex=True)
+        assert RepositoryManager(repos_dir, storage, config).ssh_multiplex is True
+
     @patch("devlaunch.worktree.repo_manager.subprocess.run")
     def test_clone_repo_already_exists(self, mock_run, repo_manager):
         """Test clone returns existing repo if already exists."""
@@ -143,6 +260,55 @@ class TestRepositoryManager:
         call_args = mock_run.call_args[0][0]
         assert "fetch" in call_args
         assert "--all" in call_args
+        assert any(arg.startswith("fetch.parallel=") for arg in call_args)
+
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_fetch_all_repos_parallel(self, mock_run, repo_manager):
+        """Test fetch_all_repos fetches repositories concurrently."""
+        for i in range(8):
+            repo_path = repo_manager.get_repo_path("owner", f"repo{i}")
+            (repo_path / ".git").mkdir(parents=True)
+            repo_manager.storage.add_repository(
+                BaseRepository(
+                    owner="owner",
+                    repo=f"repo{i}",
+                    remote_url=f"https://github.com/owner/repo{i}.git",
+                    local_path=repo_path,
+                )
+            )
+
+        # Each fetch only returns once another one is in flight at the same time,
+        # so serial fetches break the barrier and report failure
+        in_flight = threading.Barrier(2, timeout=5)
+
+        def overlapping_fetch(*args, **kwargs):
+            in_flight.wait()
+            return MagicMock(stdout="", stderr="", returncode=0)
+
+        mock_run.side_effect = overlapping_fetch
+
+        results = repo_manager.fetch_all_repos(max_workers=8)
+
+        assert results == {f"owner/repo{i}": True for i in range(8)}
+        # https remotes are never multiplexed
+        assert mock_run.call_args.kwargs["env"] is None
+
+    @patch("devlaunch.worktree.repo_manager.Path.home")
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_fetch_all_repos_reports_failures(self, mock_run, mock_home, repo_manager, temp_dirs):
+        """Test fetch_all_repos reports repos that failed without raising."""
+        mock_home.return_value = temp_dirs[0].parent
+        repo_manager.storage.add_repository(
+            BaseRepository(
+                owner="owner",
+                repo="missing",
+                remote_url="https://github.com/owner/missing.git",
+                local_path=repo_manager.get_repo_path("owner", "missing"),
+            )
+        )
+
+        assert repo_manager.fetch_all_repos() == {"owner/missing": False}
+        assert not mock_run.called
 
     def test_fetch_repo_not_exists(self, repo_manager):
         """Test fetch raises error for non-existent repo."""
@@ -230,6 +396,53 @@ class TestRepositoryManager:
         assert result is not None
         assert not mock_run.called
 
+    @staticmethod
+    def _overlapping_clone(parties):
+        """Build a subprocess.run side effect whose clones only finish together.
+
+        Every clone waits until `parties` clones are in flight at once, so
+        clones that run one after another break the barrier and fail.
+        """
+        in_flight = threading.Barrier(parties, timeout=5)
+
+        def run(args, **kwargs):
+            if "clone" in args:
+                in_flight.wait()
+                Path(args[-1]).mkdir(parents=True, exist_ok=True)
+                (Path(args[-1]) / "HEAD").touch()
+            return MagicMock(stdout="refs/heads/main\n", stderr="", returncode=0)
+
+        return run
+
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_ensure_repo_async(self, mock_run, repo_manager):
+        """Test ensure_repo_async clones several repos concurrently."""
+        mock_run.side_effect = self._overlapping_clone(4)
+
+        async def ensure_all():
+            return await asyncio.gather(
+                *(repo_manager.ensure_repo_async("owner", f"repo{i}", f"url{i}") for i in range(4))
+            )
+
+        results = asyncio.run(ensure_all())
+
+        assert [r.repo for r in results] == ["repo0", "repo1", "repo2", "repo3"]
+
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_prefetch_overlaps(self, mock_run, repo_manager):
+        """Test prefetch clones repos in the background concurrently."""
+        mock_run.side_effect = self._overlapping_clone(4)
+
+        with repo_manager:
+            futures = repo_manager.prefetch(
+                [("owner", f"repo{i}", f"https://github.com/owner/repo{i}.git") for i in range(4)]
+            )
+
+        assert all(f.done() for f in futures)
+        assert [f.result().repo for f in futures] == ["repo0", "repo1", "repo2", "repo3"]
+        assert len(repo_manager.list_repositories()) == 4
+        assert repo_manager._prefetch_pool is None
+
     def test_get_repo_returns_none_if_dir_missing(self, repo_manager):
         """Test get_repo returns None if directory is missing."""
         # Add to storage without creating directory
@@ -315,6 +528,41 @@ class TestRepositoryManager:
         assert repo_manager.storage.get_repository("owner", "repo") is None
         assert not repo_path.exists()  # Directory should be removed
 
+    def test_remove_large_repository_fast(self, repo_manager):
+        """Test removing a repository directory containing many files."""
+        repo_path = repo_manager.get_repo_path("owner", "repo")
+        objects_dir = repo_path / ".git" / "objects"
+        objects_dir.mkdir(parents=True)
+        for i in range(500):
+            (objects_dir / f"obj{i}").write_text("x")
+
+        repo_manager.remove_repository("owner", "repo")
+
+        assert not repo_path.exists()
+
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_remove_repository_falls_back_to_rmtree(self, mock_run, repo_manager):
+        """Test removal falls back to shutil.rmtree when rm is unavailable."""
+        mock_run.side_effect = OSError("rm not found")
+        repo_path = repo_manager.get_repo_path("owner", "repo")
+        repo_path.mkdir(parents=True)
+        (repo_path / ".git").mkdir()
+
+        repo_manager.remove_repository("owner", "repo")
+
+        assert not repo_path.exists()
+
+    @patch("devlaunch.worktree.repo_manager.shutil.rmtree")
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_remove_repository_surfaces_rmtree_failure(self, mock_run, mock_rmtree, repo_manager):
+        """Test a directory that cannot be removed raises instead of being skipped."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, ["rm"])
+        mock_rmtree.side_effect = PermissionError("busy")
+        repo_manager.get_repo_path("owner", "repo").mkdir(parents=True)
+
+        with pytest.raises(PermissionError):
+            repo_manager.remove_repository("owner", "repo")
+
     def test_remove_repository_keep_directory(self, repo_manager):
         """Test removing a repository without deleting directory."""
         # Create repo directory
@@ -358,10 +606,10 @@ class TestGetDefaultBranch:
     @patch("devlaunch.worktree.repo_manager.subprocess.run")
     def test_get_default_branch_fallback_main(self, mock_run, repo_manager):
         """Test fallback to main branch."""
-        # First call fails, second returns branches
+        # symbolic-ref fails, for-each-ref resolves the first matching remote ref
         mock_run.side_effect = [
             subprocess.CalledProcessError(1, "git symbolic-ref"),
-            MagicMock(stdout="origin/main\n", stderr="", returncode=0),
+            MagicMock(stdout="main\n", stderr="", returncode=0),
         ]
 
         repo_path = repo_manager.get_repo_path("owner", "repo")
@@ -373,10 +621,10 @@ class TestGetDefaultBranch:
     @patch("devlaunch.worktree.repo_manager.subprocess.run")
     def test_get_default_branch_fallback_master(self, mock_run, repo_manager):
         """Test fallback to master branch."""
-        # First call fails, second returns branches
+        # symbolic-ref fails, for-each-ref resolves the first matching remote ref
         mock_run.side_effect = [
             subprocess.CalledProcessError(1, "git symbolic-ref"),
-            MagicMock(stdout="origin/master\n", stderr="", returncode=0),
+            MagicMock(stdout="master\n", stderr="", returncode=0),
         ]
 
         repo_path = repo_manager.get_repo_path("owner", "repo")
@@ -384,6 +632,22 @@ class TestGetDefaultBranch:
 
         result = repo_manager._get_default_branch(repo_path)
         assert result == "master"
+        assert mock_run.call_count == 2
+        assert "for-each-ref" in mock_run.call_args[0][0]
+
+    @patch("devlaunch.worktree.repo_manager.subprocess.run")
+    def test_get_default_branch_fallback_no_remote_refs(self, mock_run, repo_manager):
+        """Test fallback to main when for-each-ref finds no remote refs."""
+        mock_run.side_effect = [
+            subprocess.CalledProcessError(1, "git symbolic-ref"),
+            MagicMock(stdout="", stderr="", returncode=0),
+        ]
+
+        repo_path = repo_manager.get_repo_path("owner", "repo")
+        repo_path.mkdir(parents=True)
+
+        result = repo_manager._get_default_branch(repo_path)
+        assert result == "main"
 
     @patch("devlaunch.worktree.repo_manager.subprocess.run")
     def test_get_default_branch_ultimate_fallback(self, mock_run, repo_manager):
@@ -2,7 +2,7 @@
 # pylint: disable=redefined-outer-name
 
 import json
-import tempfile
+import uuid
 from datetime import datetime
 from pathlib import Path
 
@@ -13,24 +13,27 @@ from devlaunch.worktree.storage import MetadataStorage
 
 
 @pytest.fixture
-def temp_storage():
+def temp_dir(module_tmp_path):
+    """Return a unique, not-yet-created subdirectory of the module temp dir."""
+    return module_tmp_path / uuid.uuid4().hex
+
+
+@pytest.fixture
+def temp_storage(temp_dir):
     """Create a temporary storage instance."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        metadata_path = Path(tmpdir) / "metadata.json"
-        storage = MetadataStorage(metadata_path)
-        yield storage
+    metadata_path = temp_dir / "metadata.json"
+    return MetadataStorage(metadata_path)
 
 
 class TestMetadataStorage:
     """Tests for MetadataStorage class."""
 
-    def test_init_creates_parent_dir(self):
+    def test_init_creates_parent_dir(self, temp_dir):
         """Test that initialization creates parent directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            metadata_path = Path(tmpdir) / "subdir" / "metadata.json"
-            storage = MetadataStorage(metadata_path)
-            assert metadata_path.parent.exists()
-            assert storage.metadata_path == metadata_path
+        metadata_path = temp_dir / "subdir" / "metadata.json"
+        storage = MetadataStorage(metadata_path)
+        assert metadata_path.parent.exists()
+        assert storage.metadata_path == metadata_path
 
     def test_init_loads_empty_state(self, temp_storage):
         """Test that initialization creates empty repositories and worktrees."""
@@ -279,34 +282,33 @@ class TestMetadataStorage:
         """Test removing a non-existent worktree doesn't raise."""
         temp_storage.remove_worktree("nonexistent", "repo", "branch")
 
-    def test_persistence(self):
+    def test_persistence(self, temp_dir):
         """Test that data persists across storage instances."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            metadata_path = Path(tmpdir) / "metadata.json"
+        metadata_path = temp_dir / "metadata.json"
 
-            # Create and populate first storage instance
-            storage1 = MetadataStorage(metadata_path)
-            repo = BaseRepository(
-                owner="test-owner",
-                repo="test-repo",
-                remote_url="https://github.com/test-owner/test-repo.git",
-                local_path=Path("/tmp/repos/test-owner/test-repo"),
-            )
-            storage1.add_repository(repo)
+        # Create and populate first storage instance
+        storage1 = MetadataStorage(metadata_path)
+        repo = BaseRepository(
+            owner="test-owner",
+            repo="test-repo",
+            remote_url="https://github.com/test-owner/test-repo.git",
+            local_path=Path("/tmp/repos/test-owner/test-repo"),
+        )
+        storage1.add_repository(repo)
 
-            worktree = WorktreeInfo(
-                owner="test-owner",
-                repo="test-repo",
-                branch="feature-branch",
-                local_path=Path("/tmp/worktrees/test-owner/test-repo/feature-branch"),
-                workspace_id="feature-branch",
-            )
-            storage1.add_worktree(worktree)
+        worktree = WorktreeInfo(
+            owner="test-owner",
+            repo="test-repo",
+            branch="feature-branch",
+            local_path=Path("/tmp/worktrees/test-owner/test-repo/feature-branch"),
+            workspace_id="feature-branch",
+        )
+        storage1.add_worktree(worktree)
 
-            # Create second storage instance and verify data persists
-            storage2 = MetadataStorage(metadata_path)
-            assert storage2.get_repository("test-owner", "test-repo") is not None
-            assert storage2.get_worktree("test-owner", "test-repo", "feature-branch") is not None
+        # Create second storage instance and verify data persists
+        storage2 = MetadataStorage(metadata_path)
+        assert storage2.get_repository("test-owner", "test-repo") is not None
+        assert storage2.get_worktree("test-owner", "test-repo", "feature-branch") is not None
 
     def test_save_creates_valid_json(self, temp_storage):
         """Test that save creates valid JSON file."""
@@ -317,6 +319,7 @@ class TestMetadataStorage:
             local_path=Path("/tmp/repos/test-owner/test-repo"),
         )
         temp_storage.add_repository(repo)
+        temp_storage.save()
 
         # Read the file directly and verify it's valid JSON
         with open(temp_storage.metadata_path, "r", encoding="utf-8") as f:
@@ -325,3 +328,143 @@ class TestMetadataStorage:
         assert "repositories" in data
         assert "worktrees" in data
         assert "test-owner/test-repo" in data["repositories"]
+
+    def test_mutations_append_to_log(self, temp_storage):
+        """Test that mutations are appended to the JSONL log, not the JSON file."""
+        repo = BaseRepository(
+            owner="test-owner",
+            repo="test-repo",
+            remote_url="https://github.com/test-owner/test-repo.git",
+            local_path=Path("/tmp/repos/test-owner/test-repo"),
+        )
+        temp_storage.add_repository(repo)
+        temp_storage.remove_repository("test-owner", "test-repo")
+
+        assert not temp_storage.metadata_path.exists()
+        log_path = temp_storage.metadata_path.with_suffix(".jsonl")
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [r["op"] for r in records] == ["add_repo", "remove_repo"]
+
+    def test_jsonl_replay_recovers_state(self, temp_dir):
+        """Test that a new instance replays log lines that were never compacted."""
+        metadata_path = temp_dir / "metadata.json"
+        storage1 = MetadataStorage(metadata_path)
+        storage1.add_repository(
+            BaseRepository(
+                owner="test-owner",
+                repo="test-repo",
+                remote_url="https://github.com/test-owner/test-repo.git",
+                local_path=Path("/tmp/repos/test-owner/test-repo"),
+            )
+        )
+        storage1.add_worktree(
+            WorktreeInfo(
+                owner="test-owner",
+                repo="test-repo",
+                branch="feature-branch",
+                local_path=Path("/tmp/worktrees/test-owner/test-repo/feature-branch"),
+                workspace_id="feature-branch",
+            )
+        )
+        storage1.add_worktree(
+            WorktreeInfo(
+                owner="test-owner",
+                repo="test-repo",
+                branch="old-branch",
+                local_path=Path("/tmp/worktrees/test-owner/test-repo/old-branch"),
+                workspace_id="old-branch",
+            )
+        )
+        storage1.remove_worktree("test-owner", "test-repo", "old-branch")
+        # Simulate a write interrupted part-way through a line
+        with open(metadata_path.with_suffix(".jsonl"), "a", encoding="utf-8") as f:
+            f.write('{"op": "remove_repo", "da')
+
+        storage2 = MetadataStorage(metadata_path)
+
+        assert storage2.get_worktree("test-owner", "test-repo", "feature-branch") is not None
+        assert storage2.get_worktree("test-owner", "test-repo", "old-branch") is None
+        repo = storage2.get_repository("test-owner", "test-repo")
+        assert repo is not None
+        assert repo.worktrees == ["feature-branch"]
+
+    def test_append_after_torn_line_survives_reload(self, temp_dir):
+        """Test that a record appended after a torn log line is replayed on reload."""
+        metadata_path = temp_dir / "metadata.json"
+        storage1 = MetadataStorage(metadata_path)
+        storage1.add_repository(
+            BaseRepository(
+                owner="o",
+                repo="a",
+                remote_url="https://github.com/o/a.git",
+                local_path=Path("/tmp/repos/o/a"),
+            )
+        )
+        with open(metadata_path.with_suffix(".jsonl"), "a", encoding="utf-8") as f:
+            f.write('{"op": "remove_repo", "da')
+
+        storage2 = MetadataStorage(metadata_path)
+        storage2.add_repository(
+            BaseRepository(
+                owner="o",
+                repo="b",
+                remote_url="https://github.com/o/b.git",
+                local_path=Path("/tmp/repos/o/b"),
+            )
+        )
+
+        reloaded = MetadataStorage(metadata_path)
+        assert [r.key for r in reloaded.list_repositories()] == ["o/a", "o/b"]
+
+    @pytest.mark.parametrize(
+        "bad_line",
+        ['{"op": "remove_repo", "da', '["not", "a", "record"]', '{"op": "add_repo"}'],
+    )
+    def test_corrupt_middle_log_line_is_skipped(self, temp_dir, bad_line):
+        """Test that a bad complete line is skipped without dropping later records."""
+        metadata_path = temp_dir / "metadata.json"
+        storage1 = MetadataStorage(metadata_path)
+        storage1.add_repository(
+            BaseRepository(
+                owner="o",
+                repo="a",
+                remote_url="https://github.com/o/a.git",
+                local_path=Path("/tmp/repos/o/a"),
+            )
+        )
+        log_path = metadata_path.with_suffix(".jsonl")
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(bad_line + "\n")
+        storage1.add_repository(
+            BaseRepository(
+                owner="o",
+                repo="b",
+                remote_url="https://github.com/o/b.git",
+                local_path=Path("/tmp/repos/o/b"),
+            )
+        )
+        log_size = log_path.stat().st_size
+
+        reloaded = MetadataStorage(metadata_path)
+
+        assert [r.key for r in reloaded.list_repositories()] == ["o/a", "o/b"]
+        assert log_path.stat().st_size == log_size
+
+    def test_save_compacts_log(self, temp_storage):
+        """Test that save folds the log into the JSON file and truncates the log."""
+        temp_storage.add_repository(
+            BaseRepository(
+                owner="test-owner",
+                repo="test-repo",
+                remote_url="https://github.com/test-owner/test-repo.git",
+                local_path=Path("/tmp/repos/test-owner/test-repo"),
+            )
+        )
+        log_path = temp_storage.metadata_path.with_suffix(".jsonl")
+        assert log_path.exists()
+
+        temp_storage.save()
+
+        assert not log_path.exists()
+        reloaded = MetadataStorage(temp_storage.metadata_path)
+        assert reloaded.get_repository("test-owner", "test-repo") is not None
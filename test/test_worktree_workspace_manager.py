@@ -1,9 +1,13 @@
 """Tests for worktree workspace manager."""
 # pylint: disable=redefined-outer-name,unused-argument,unused-variable
 
-import tempfile
+import fcntl
+import json
+from contextlib import nullcontext
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -11,6 +15,27 @@ from devlaunch.worktree.models import WorktreeInfo
 from devlaunch.worktree.workspace_manager import WorkspaceManager, run_devpod
 
 
+class _Recorder:
+    """Callable stand-in that records its calls and returns a fixed process result."""
+
+    def __init__(self, returncode=0, stdout="", stderr=""):
+        self.calls = []
+        self.result = SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.result
+
+
+def _flag_map(argv):
+    """Map each --flag in a devpod argv list to the value that follows it."""
+    return {
+        flag: value
+        for flag, value in zip(argv[:-1], argv[1:], strict=True)
+        if flag.startswith("--")
+    }
+
+
 @pytest.fixture
 def mock_worktree_manager():
     """Create a mock worktree manager."""
@@ -25,6 +50,19 @@ def mock_storage():
     return MagicMock()
 
 
+@pytest.fixture(scope="module")
+def tmp_home(tmp_path_factory):
+    """Home directory shared by the tests in this module, created once."""
+    return tmp_path_factory.mktemp("home")
+
+
+@pytest.fixture
+def fake_home(tmp_home):
+    """Point Path.home() at the shared temporary home for lock files."""
+    with patch.object(Path, "home", return_value=tmp_home):
+        yield tmp_home
+
+
 @pytest.fixture
 def workspace_manager(mock_worktree_manager, mock_storage):
     """Create a workspace manager with mocks."""
@@ -34,30 +72,35 @@ def workspace_manager(mock_worktree_manager, mock_storage):
 class TestRunDevpod:
     """Tests for run_devpod function."""
 
-    @patch("devlaunch.worktree.workspace_manager.subprocess.run")
-    def test_run_devpod_without_capture(self, mock_run):
+    @pytest.fixture(autouse=True)
+    def _devpod_bin(self, monkeypatch):
+        """Pin the resolved devpod binary so argv checks don't depend on PATH."""
+        monkeypatch.setattr("devlaunch.worktree.workspace_manager._DEVPOD_BIN", "/opt/bin/devpod")
+
+    def test_run_devpod_without_capture(self, monkeypatch):
         """Test running devpod without capturing output."""
-        mock_run.return_value = MagicMock(returncode=0)
+        recorder = _Recorder()
+        monkeypatch.setattr("devlaunch.worktree.workspace_manager.subprocess.run", recorder)
 
         result = run_devpod(["up", "workspace"], capture=False)
 
-        mock_run.assert_called_once_with(["devpod", "up", "workspace"], check=False)
+        assert recorder.calls == [((["/opt/bin/devpod", "up", "workspace"],), {"check": False})]
         assert result.returncode == 0
 
-    @patch("devlaunch.worktree.workspace_manager.subprocess.run")
-    def test_run_devpod_with_capture(self, mock_run):
+    def test_run_devpod_with_capture(self, monkeypatch):
         """Test running devpod with captured output."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="output", stderr="")
+        recorder = _Recorder(stdout="output")
+        monkeypatch.setattr("devlaunch.worktree.workspace_manager.subprocess.run", recorder)
 
         result = run_devpod(["list", "--output", "json"], capture=True)
 
-        mock_run.assert_called_once_with(
-            ["devpod", "list", "--output", "json"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result.returncode == 0
+        assert recorder.calls == [
+            (
+                (["/opt/bin/devpod", "list", "--output", "json"],),
+                {"capture_output": True, "text": True, "check": False},
+            )
+        ]
+        assert result.stdout == "output"
 
 
 class TestWorkspaceManagerCreate:
@@ -66,7 +109,7 @@ class TestWorkspaceManagerCreate:
     @patch("devlaunch.worktree.workspace_manager.run_devpod")
     @patch("devlaunch.worktree.workspace_manager.fcntl.flock")
     def test_create_workspace_uses_lock(
-        self, mock_flock, mock_run_devpod, workspace_manager, mock_worktree_manager
+        self, mock_flock, mock_run_devpod, workspace_manager, mock_worktree_manager, fake_home
     ):
         """Test that create_workspace acquires a lock."""
         worktree = WorktreeInfo(
@@ -77,19 +120,24 @@ class TestWorkspaceManagerCreate:
             workspace_id="main",
         )
         mock_worktree_manager.ensure_worktree.return_value = worktree
-        mock_run_devpod.return_value = MagicMock(returncode=0)
+        mock_run_devpod.return_value = Mock(spec_set=["returncode"], returncode=0)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch.object(Path, "home", return_value=Path(tmpdir)):
-                workspace_manager.create_workspace("owner", "repo", "main")
+        with patch(
+            "devlaunch.worktree.workspace_manager.open", wraps=open, create=True
+        ) as mock_open:
+            workspace_manager.create_workspace("owner", "repo", "main")
 
-        # Check that flock was called (lock acquired and released)
-        assert mock_flock.call_count >= 2  # LOCK_EX and LOCK_UN
+        # Lock file is opened once and held across LOCK_EX and LOCK_UN
+        mock_open.assert_called_once()
+        assert mock_open.call_args.args[0] == fake_home / ".devlaunch" / "locks" / "owner-repo.lock"
+        (ex_fd, ex_op), (un_fd, un_op) = (call.args for call in mock_flock.call_args_list)
+        assert ex_fd is un_fd
+        assert (ex_op, un_op) == (fcntl.LOCK_EX, fcntl.LOCK_UN)
 
     @patch("devlaunch.worktree.workspace_manager.run_devpod")
-    @patch("devlaunch.worktree.workspace_manager.fcntl.flock")
+    @patch("devlaunch.worktree.workspace_manager._locked", return_value=nullcontext())
     def test_create_workspace_mounts_base_repo(
-        self, mock_flock, mock_run_devpod, workspace_manager, mock_worktree_manager
+        self, mock_locked, mock_run_devpod, workspace_manager, mock_worktree_manager
     ):
         """Test that create_workspace mounts the base repo directory."""
         worktree = WorktreeInfo(
@@ -100,24 +148,21 @@ class TestWorkspaceManagerCreate:
             workspace_id="feature",
         )
         mock_worktree_manager.ensure_worktree.return_value = worktree
-        mock_run_devpod.return_value = MagicMock(returncode=0)
+        mock_run_devpod.return_value = Mock(spec_set=["returncode"], returncode=0)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch.object(Path, "home", return_value=Path(tmpdir)):
-                workspace_manager.create_workspace("owner", "repo", "feature")
+        workspace_manager.create_workspace("owner", "repo", "feature")
 
         # Check that devpod was called with the BASE REPO path (not worktree)
         # This is required so the .git directory is accessible for git commands
         call_args = mock_run_devpod.call_args[0][0]
         assert "/tmp/repos/owner/repo" in call_args
         assert "/tmp/repos/owner/repo/.worktrees" not in " ".join(call_args)
-        assert "--id" in call_args
-        assert "feature" in call_args
+        assert _flag_map(call_args)["--id"] == "feature"
 
     @patch("devlaunch.worktree.workspace_manager.run_devpod")
-    @patch("devlaunch.worktree.workspace_manager.fcntl.flock")
+    @patch("devlaunch.worktree.workspace_manager._locked", return_value=nullcontext())
     def test_create_workspace_uses_branch_as_id(
-        self, mock_flock, mock_run_devpod, workspace_manager, mock_worktree_manager
+        self, mock_locked, mock_run_devpod, workspace_manager, mock_worktree_manager
     ):
         """Test that workspace ID is derived from branch name."""
         worktree = WorktreeInfo(
@@ -128,24 +173,18 @@ class TestWorkspaceManagerCreate:
             workspace_id="feature-my-feature",
         )
         mock_worktree_manager.ensure_worktree.return_value = worktree
-        mock_run_devpod.return_value = MagicMock(returncode=0)
+        mock_run_devpod.return_value = Mock(spec_set=["returncode"], returncode=0)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch.object(Path, "home", return_value=Path(tmpdir)):
-                result, _ = workspace_manager.create_workspace(
-                    "owner", "repo", "feature/my-feature"
-                )
+        result, _ = workspace_manager.create_workspace("owner", "repo", "feature/my-feature")
 
         # Check workspace ID is sanitized branch name
-        call_args = mock_run_devpod.call_args[0][0]
-        assert "--id" in call_args
-        id_index = call_args.index("--id")
-        assert call_args[id_index + 1] == "feature-my-feature"
+        flags = _flag_map(mock_run_devpod.call_args[0][0])
+        assert flags["--id"] == "feature-my-feature"
 
     @patch("devlaunch.worktree.workspace_manager.run_devpod")
-    @patch("devlaunch.worktree.workspace_manager.fcntl.flock")
+    @patch("devlaunch.worktree.workspace_manager._locked", return_value=nullcontext())
     def test_create_workspace_with_ide(
-        self, mock_flock, mock_run_devpod, workspace_manager, mock_worktree_manager
+        self, mock_locked, mock_run_devpod, workspace_manager, mock_worktree_manager
     ):
         """Test creating workspace with IDE."""
         worktree = WorktreeInfo(
@@ -156,20 +195,17 @@ class TestWorkspaceManagerCreate:
             workspace_id="main",
         )
         mock_worktree_manager.ensure_worktree.return_value = worktree
-        mock_run_devpod.return_value = MagicMock(returncode=0)
+        mock_run_devpod.return_value = Mock(spec_set=["returncode"], returncode=0)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch.object(Path, "home", return_value=Path(tmpdir)):
-                workspace_manager.create_workspace("owner", "repo", "main", ide="vscode")
+        workspace_manager.create_workspace("owner", "repo", "main", ide="vscode")
 
-        call_args = mock_run_devpod.call_args[0][0]
-        assert "--ide" in call_args
-        assert "vscode" in call_args
+        flags = _flag_map(mock_run_devpod.call_args[0][0])
+        assert flags["--ide"] == "vscode"
 
     @patch("devlaunch.worktree.workspace_manager.run_devpod")
-    @patch("devlaunch.worktree.workspace_manager.fcntl.flock")
+    @patch("devlaunch.worktree.workspace_manager._locked", return_value=nullcontext())
     def test_create_workspace_failure(
-        self, mock_flock, mock_run_devpod, workspace_manager, mock_worktree_manager
+        self, mock_locked, mock_run_devpod, workspace_manager, mock_worktree_manager
     ):
         """Test that creation failure raises error."""
         worktree = WorktreeInfo(
@@ -180,52 +216,51 @@ class TestWorkspaceManagerCreate:
             workspace_id="main",
         )
         mock_worktree_manager.ensure_worktree.return_value = worktree
-        mock_run_devpod.return_value = MagicMock(returncode=1)
+        mock_run_devpod.return_value = Mock(spec_set=["returncode"], returncode=1)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch.object(Path, "home", return_value=Path(tmpdir)):
-                with pytest.raises(RuntimeError, match="DevPod failed"):
-                    workspace_manager.create_workspace("owner", "repo", "main")
+        with pytest.raises(RuntimeError, match="DevPod failed"):
+            workspace_manager.create_workspace("owner", "repo", "main")
 
 
 class TestWorkspaceManagerOperations:
     """Tests for workspace operations."""
 
-    @patch("devlaunch.worktree.workspace_manager.run_devpod")
-    def test_start_workspace(self, mock_run_devpod, workspace_manager):
+    def test_start_workspace(self, monkeypatch, workspace_manager):
         """Test starting a workspace."""
-        mock_run_devpod.return_value = MagicMock(returncode=0)
+        recorder = _Recorder()
+        monkeypatch.setattr("devlaunch.worktree.workspace_manager.run_devpod", recorder)
 
         workspace_manager.start_workspace("my-workspace")
 
-        mock_run_devpod.assert_called_once_with(["up", "my-workspace"], capture=False)
+        assert recorder.calls == [((["up", "my-workspace"],), {"capture": False})]
 
-    @patch("devlaunch.worktree.workspace_manager.run_devpod")
-    def test_stop_workspace(self, mock_run_devpod, workspace_manager):
+    def test_stop_workspace(self, monkeypatch, workspace_manager):
         """Test stopping a workspace."""
-        mock_run_devpod.return_value = MagicMock(returncode=0, stdout="stopped")
+        recorder = _Recorder(stdout="stopped")
+        monkeypatch.setattr("devlaunch.worktree.workspace_manager.run_devpod", recorder)
 
         result = workspace_manager.stop_workspace("my-workspace")
 
-        mock_run_devpod.assert_called_once_with(["stop", "my-workspace"], capture=True)
+        assert recorder.calls == [((["stop", "my-workspace"],), {"capture": True})]
         assert result == "stopped"
 
-    @patch("devlaunch.worktree.workspace_manager.run_devpod")
-    def test_delete_workspace(self, mock_run_devpod, workspace_manager):
+    def test_delete_workspace(self, monkeypatch, workspace_manager):
         """Test deleting a workspace."""
-        mock_run_devpod.return_value = MagicMock(returncode=0, stdout="deleted")
+        recorder = _Recorder(stdout="deleted")
+        monkeypatch.setattr("devlaunch.worktree.workspace_manager.run_devpod", recorder)
 
         result = workspace_manager.delete_workspace("my-workspace")
 
-        mock_run_devpod.assert_called_once_with(["delete", "my-workspace"], capture=True)
+        assert recorder.calls == [((["delete", "my-workspace"],), {"capture": True})]
         assert result == "deleted"
 
-    @patch("devlaunch.worktree.workspace_manager.run_devpod")
     def test_delete_workspace_with_worktree_removal(
-        self, mock_run_devpod, workspace_manager, mock_storage, mock_worktree_manager
+        self, monkeypatch, workspace_manager, mock_storage, mock_worktree_manager
     ):
         """Test deleting a workspace and its worktree."""
-        mock_run_devpod.return_value = MagicMock(returncode=0, stdout="deleted")
+        monkeypatch.setattr(
+            "devlaunch.worktree.workspace_manager.run_devpod", _Recorder(stdout="deleted")
+        )
 
         worktree = WorktreeInfo(
             owner="owner",
@@ -260,9 +295,6 @@ class TestWorkspaceManagerList:
         self, mock_run_devpod, workspace_manager, mock_storage
     ):
         """Test listing workspaces enhances with worktree info."""
-        import json
-        from datetime import datetime
-
         mock_run_devpod.return_value = MagicMock(
             returncode=0,
             stdout=json.dumps([{"id": "main", "status": "Running"}]),
@@ -285,3 +317,29 @@ class TestWorkspaceManagerList:
         assert result[0]["backend"] == "worktree"
         assert result[0]["worktree"]["branch"] == "main"
         assert result[0]["worktree"]["owner"] == "owner"
+
+    @patch("devlaunch.worktree.workspace_manager.run_devpod")
+    def test_list_workspaces_matches_both_worktree_ids(
+        self, mock_run_devpod, workspace_manager, mock_storage
+    ):
+        """Test a worktree is found by either ID, with separate info per workspace."""
+        mock_run_devpod.return_value = MagicMock(
+            returncode=0,
+            stdout=json.dumps([{"id": "ws-main"}, {"id": "main"}, {"id": "plain"}]),
+        )
+        mock_storage.list_worktrees.return_value = [
+            WorktreeInfo(
+                owner="owner",
+                repo="repo",
+                branch="main",
+                local_path=Path("/tmp/worktrees/main"),
+                workspace_id="main",
+                devpod_workspace_id="ws-main",
+            )
+        ]
+
+        by_devpod_id, by_workspace_id, plain = workspace_manager.list_workspaces()
+
+        assert by_devpod_id["worktree"] == by_workspace_id["worktree"]
+        assert by_devpod_id["worktree"] is not by_workspace_id["worktree"]
+        assert plain["backend"] == "devpod"
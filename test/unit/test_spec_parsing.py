@@ -3,239 +3,217 @@
 These are pure logic tests with no external commands - they test
 data parsing, validation, and transformation functions.
 """
+# pylint: disable=redefined-outer-name
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
 
 import pytest
 
-from devlaunch.worktree.worktree_manager import sanitize_branch_name
+from devlaunch.worktree.config import WorktreeConfig
+from devlaunch.worktree.models import BaseRepository, WorktreeInfo
+from devlaunch.worktree.worktree_manager import (
+    MAX_WORKSPACE_ID_LEN,
+    WorktreeManager,
+    sanitize_branch_name,
+)
+
+_REPO_PATH = Path("/tmp/repos/owner/repo")
+_WT_FEATURE_PATH = Path("/tmp/worktrees/feature-test")
+_REPOS_DIR = Path("/tmp/repos")
+# Serialized as "2024-01-01T12:00:00" and "2024-01-02T12:00:00"
+_DT_1 = datetime(2024, 1, 1, 12, 0, 0)
+_DT_2 = datetime(2024, 1, 2, 12, 0, 0)
+_LONG_BRANCH = "feature/" + "x" * 100
+
+# Each model's constructor arguments and their serialized form, shared by the
+# to_dict and from_dict directions. from_dict gets a fresh top-level copy, so
+# a from_dict that added or popped keys could not leak into the next test.
+_BASE_REPO_KWARGS: Dict[str, Any] = {
+    "owner": "owner",
+    "repo": "repo",
+    "remote_url": "https://github.com/owner/repo.git",
+    "local_path": _REPO_PATH,
+    "default_branch": "main",
+    "last_fetched": _DT_1,
+    "worktrees": ["main", "develop"],
+}
+_BASE_REPO_DICT: Dict[str, Any] = {
+    "owner": "owner",
+    "repo": "repo",
+    "remote_url": "https://github.com/owner/repo.git",
+    "local_path": "/tmp/repos/owner/repo",
+    "default_branch": "main",
+    "last_fetched": "2024-01-01T12:00:00",
+    "worktrees": ["main", "develop"],
+}
+_WORKTREE_KWARGS: Dict[str, Any] = {
+    "owner": "owner",
+    "repo": "repo",
+    "branch": "feature/test",
+    "local_path": _WT_FEATURE_PATH,
+    "workspace_id": "owner-repo-feature-test",
+    "created_at": _DT_1,
+    "last_used": _DT_2,
+    "devpod_workspace_id": None,
+}
+_WORKTREE_DICT: Dict[str, Any] = {
+    "owner": "owner",
+    "repo": "repo",
+    "branch": "feature/test",
+    "local_path": "/tmp/worktrees/feature-test",
+    "workspace_id": "owner-repo-feature-test",
+    "created_at": "2024-01-01T12:00:00",
+    "last_used": "2024-01-02T12:00:00",
+    "devpod_workspace_id": None,
+}
+
+# WorktreeConfig.from_dict input
+_CONFIG_DATA: Dict[str, Any] = {
+    "worktree": {
+        "enabled": False,
+        "repos_dir": "/custom/path",
+        "auto_fetch": False,
+        "fetch_interval": 7200,
+        "cleanup": {
+            "auto_prune": False,
+            "prune_after_days": 60,
+        },
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def sample_repo():
+    """BaseRepository shared by the serialization tests."""
+    return BaseRepository(**_BASE_REPO_KWARGS)
+
+
+@pytest.fixture(scope="module")
+def sample_worktree():
+    """WorktreeInfo shared by the serialization tests."""
+    return WorktreeInfo(**_WORKTREE_KWARGS)
+
+
+@pytest.fixture(scope="module")
+def wt_manager():
+    """Bare WorktreeManager for calling its pure helpers without any storage."""
+    return WorktreeManager.__new__(WorktreeManager)
 
 
-@pytest.mark.unit
 class TestSanitizeBranchName:
     """Tests for branch name sanitization."""
 
-    def test_simple_branch_unchanged(self):
-        """Test that simple branch names pass through."""
-        assert sanitize_branch_name("main") == "main"
-        assert sanitize_branch_name("develop") == "develop"
-        assert sanitize_branch_name("feature") == "feature"
-
-    def test_slash_replaced_with_hyphen(self):
-        """Test that slashes are replaced with hyphens."""
-        assert sanitize_branch_name("feature/test") == "feature-test"
-        assert sanitize_branch_name("fix/bug/critical") == "fix-bug-critical"
-
-    def test_special_chars_replaced(self):
-        """Test that special characters are replaced with underscores."""
-        assert sanitize_branch_name("feature@test") == "feature_test"
-        assert sanitize_branch_name("fix#123") == "fix_123"
-
-    def test_alphanumeric_preserved(self):
-        """Test that alphanumeric characters are preserved."""
-        assert sanitize_branch_name("v1.2.3") == "v1.2.3"
-        assert sanitize_branch_name("release-2024") == "release-2024"
-
-    def test_leading_trailing_dots_stripped(self):
-        """Test that leading/trailing dots and hyphens are stripped."""
-        assert sanitize_branch_name(".hidden") == "hidden"
-        assert sanitize_branch_name("branch.") == "branch"
-        assert sanitize_branch_name("-dashed-") == "dashed"
-
-    def test_hyphen_underscore_dot_preserved(self):
-        """Test that hyphens, underscores, and dots in middle are preserved."""
-        assert sanitize_branch_name("feature-test") == "feature-test"
-        assert sanitize_branch_name("feature_test") == "feature_test"
-        assert sanitize_branch_name("v1.2.3-beta") == "v1.2.3-beta"
-
-
-@pytest.mark.unit
+    @pytest.mark.parametrize(
+        "branch,expected",
+        [
+            # Simple names pass through
+            ("main", "main"),
+            ("develop", "develop"),
+            ("feature", "feature"),
+            # Slashes become hyphens
+            ("feature/test", "feature-test"),
+            ("fix/bug/critical", "fix-bug-critical"),
+            # Other special characters become underscores
+            ("feature@test", "feature_test"),
+            ("fix#123", "fix_123"),
+            ("fix/ümlaut", "fix-_mlaut"),
+            # Alphanumerics, hyphens, underscores and dots are preserved
+            ("v1.2.3", "v1.2.3"),
+            ("release-2024", "release-2024"),
+            ("feature-test", "feature-test"),
+            ("feature_test", "feature_test"),
+            ("v1.2.3-beta", "v1.2.3-beta"),
+            # Leading/trailing dots and hyphens are stripped
+            (".hidden", "hidden"),
+            ("branch.", "branch"),
+            ("-dashed-", "dashed"),
+        ],
+    )
+    def test_sanitize(self, branch, expected):
+        """Test branch names are sanitized for use in paths and workspace IDs."""
+        assert sanitize_branch_name(branch) == expected
+
+
 class TestWorkspaceIdGeneration:
     """Tests for workspace ID generation."""
 
-    def test_workspace_id_format(self):
+    def test_workspace_id_format(self, wt_manager):
         """Test workspace ID format is owner-repo-branch."""
-        from devlaunch.worktree.worktree_manager import WorktreeManager
-
-        # Create a mock manager
-        manager = WorktreeManager.__new__(WorktreeManager)
-
-        workspace_id = manager._generate_workspace_id("owner", "repo", "main")  # pylint: disable=protected-access
+        workspace_id = wt_manager._generate_workspace_id("owner", "repo", "main")  # pylint: disable=protected-access
         assert workspace_id == "owner-repo-main"
 
-    def test_workspace_id_with_slash_branch(self):
+    def test_workspace_id_with_slash_branch(self, wt_manager):
         """Test workspace ID with branch containing slash."""
-        from devlaunch.worktree.worktree_manager import WorktreeManager
-
-        manager = WorktreeManager.__new__(WorktreeManager)
-
-        workspace_id = manager._generate_workspace_id("owner", "repo", "feature/test")  # pylint: disable=protected-access
+        workspace_id = wt_manager._generate_workspace_id("owner", "repo", "feature/test")  # pylint: disable=protected-access
         assert workspace_id == "owner-repo-feature-test"
 
-    def test_workspace_id_truncation(self):
+    def test_workspace_id_truncation(self, wt_manager):
         """Test workspace ID is truncated if too long."""
-        from devlaunch.worktree.worktree_manager import WorktreeManager
-
-        manager = WorktreeManager.__new__(WorktreeManager)
+        workspace_id = wt_manager._generate_workspace_id("owner", "repo", _LONG_BRANCH)  # pylint: disable=protected-access
 
-        long_branch = "feature/" + "x" * 100
-        workspace_id = manager._generate_workspace_id("owner", "repo", long_branch)  # pylint: disable=protected-access
+        assert MAX_WORKSPACE_ID_LEN == 50
+        assert len(workspace_id) <= MAX_WORKSPACE_ID_LEN
 
-        # Should be truncated to 50 chars max
-        assert len(workspace_id) <= 50
 
-
-@pytest.mark.unit
 class TestDataModels:
     """Tests for data model serialization."""
 
-    def test_base_repository_to_dict(self):
+    def test_base_repository_to_dict(self, sample_repo):
         """Test BaseRepository serialization."""
-        from devlaunch.worktree.models import BaseRepository
-        from pathlib import Path
-        from datetime import datetime
-
-        repo = BaseRepository(
-            owner="owner",
-            repo="repo",
-            remote_url="https://github.com/owner/repo.git",
-            local_path=Path("/tmp/repos/owner/repo"),
-            default_branch="main",
-            last_fetched=datetime(2024, 1, 1, 12, 0, 0),
-            worktrees=["main", "develop"],
-        )
-
-        data = repo.to_dict()
-
-        assert data["owner"] == "owner"
-        assert data["repo"] == "repo"
-        assert data["remote_url"] == "https://github.com/owner/repo.git"
-        assert data["local_path"] == "/tmp/repos/owner/repo"
-        assert data["default_branch"] == "main"
-        assert data["last_fetched"] == "2024-01-01T12:00:00"
-        assert data["worktrees"] == ["main", "develop"]
+        assert sample_repo.to_dict() == _BASE_REPO_DICT
 
-    def test_base_repository_from_dict(self):
+    def test_base_repository_from_dict(self, sample_repo):
         """Test BaseRepository deserialization."""
-        from devlaunch.worktree.models import BaseRepository
-        from pathlib import Path
-
-        data = {
-            "owner": "owner",
-            "repo": "repo",
-            "remote_url": "https://github.com/owner/repo.git",
-            "local_path": "/tmp/repos/owner/repo",
-            "default_branch": "main",
-            "last_fetched": "2024-01-01T12:00:00",
-            "worktrees": ["main"],
-        }
-
-        repo = BaseRepository.from_dict(data)
-
-        assert repo.owner == "owner"
-        assert repo.repo == "repo"
-        assert repo.local_path == Path("/tmp/repos/owner/repo")
-        assert repo.last_fetched is not None
-        assert repo.last_fetched.year == 2024
+        assert BaseRepository.from_dict(dict(_BASE_REPO_DICT)) == sample_repo
 
-    def test_worktree_info_to_dict(self):
+    def test_worktree_info_to_dict(self, sample_worktree):
         """Test WorktreeInfo serialization."""
-        from devlaunch.worktree.models import WorktreeInfo
-        from pathlib import Path
-        from datetime import datetime
-
-        worktree = WorktreeInfo(
-            owner="owner",
-            repo="repo",
-            branch="main",
-            local_path=Path("/tmp/worktrees/main"),
-            workspace_id="owner-repo-main",
-            created_at=datetime(2024, 1, 1, 12, 0, 0),
-            last_used=datetime(2024, 1, 2, 12, 0, 0),
-            devpod_workspace_id="my-workspace",
-        )
-
-        data = worktree.to_dict()
+        assert sample_worktree.to_dict() == _WORKTREE_DICT
 
-        assert data["owner"] == "owner"
-        assert data["branch"] == "main"
-        assert data["local_path"] == "/tmp/worktrees/main"
-        assert data["workspace_id"] == "owner-repo-main"
-        assert data["devpod_workspace_id"] == "my-workspace"
-
-    def test_worktree_info_from_dict(self):
+    def test_worktree_info_from_dict(self, sample_worktree):
         """Test WorktreeInfo deserialization."""
-        from devlaunch.worktree.models import WorktreeInfo
-        from pathlib import Path
-
-        data = {
-            "owner": "owner",
-            "repo": "repo",
-            "branch": "feature/test",
-            "local_path": "/tmp/worktrees/feature-test",
-            "workspace_id": "owner-repo-feature-test",
-            "created_at": "2024-01-01T12:00:00",
-            "last_used": "2024-01-02T12:00:00",
-            "devpod_workspace_id": None,
-        }
+        assert WorktreeInfo.from_dict(dict(_WORKTREE_DICT)) == sample_worktree
 
-        worktree = WorktreeInfo.from_dict(data)
+    def test_json_round_trip(self, sample_repo, sample_worktree):
+        """Test models survive the JSON encoding used by MetadataStorage."""
+        repo_data = json.loads(json.dumps(sample_repo.to_dict()))
+        worktree_data = json.loads(json.dumps(sample_worktree.to_dict()))
 
-        assert worktree.branch == "feature/test"
-        assert worktree.local_path == Path("/tmp/worktrees/feature-test")
-        assert worktree.devpod_workspace_id is None
+        assert BaseRepository.from_dict(repo_data) == sample_repo
+        assert WorktreeInfo.from_dict(worktree_data) == sample_worktree
 
 
-@pytest.mark.unit
 class TestWorktreeConfig:
     """Tests for WorktreeConfig."""
 
-    def test_config_defaults(self):
-        """Test default configuration values."""
-        from devlaunch.worktree.config import WorktreeConfig
-
-        config = WorktreeConfig()
-
-        assert config.enabled is True
-        assert config.auto_fetch is True
-        assert config.fetch_interval == 3600
-        assert config.auto_prune is True
-        assert config.prune_after_days == 30
-
     def test_config_to_dict(self):
         """Test config serialization."""
-        from devlaunch.worktree.config import WorktreeConfig
-        from pathlib import Path
-
         config = WorktreeConfig(
-            repos_dir=Path("/tmp/repos"),
+            repos_dir=_REPOS_DIR,
             auto_fetch=False,
             fallback_image="ubuntu:latest",
         )
 
-        data = config.to_dict()
-
-        assert data["worktree"]["enabled"] is True
-        assert data["worktree"]["auto_fetch"] is False
-        assert data["worktree"]["repos_dir"] == "/tmp/repos"
-        assert data["worktree"]["fallback_image"] == "ubuntu:latest"
-
-    def test_config_from_dict(self):
-        """Test config deserialization."""
-        from devlaunch.worktree.config import WorktreeConfig
-
-        data = {
+        assert config.to_dict() == {
             "worktree": {
-                "enabled": False,
-                "repos_dir": "/custom/path",
+                "enabled": True,
+                "repos_dir": "/tmp/repos",
                 "auto_fetch": False,
-                "fetch_interval": 7200,
+                "fetch_interval": 3600,
                 "cleanup": {
-                    "auto_prune": False,
-                    "prune_after_days": 60,
+                    "auto_prune": True,
+                    "prune_after_days": 30,
                 },
+                "fallback_image": "ubuntu:latest",
             }
         }
 
-        config = WorktreeConfig.from_dict(data)
+    def test_config_from_dict(self):
+        """Test config deserialization."""
+        config = WorktreeConfig.from_dict(dict(_CONFIG_DATA))
 
         assert config.enabled is False
         assert config.auto_fetch is False